@@ -12,7 +12,7 @@ from django.conf import settings
 from django.http import HttpResponse
 from django.http import Http404
 from django.http import JsonResponse
-from django.db.models import Q
+from django.db.models import BooleanField, Case, Q, Value, When
 from django.shortcuts import get_object_or_404, redirect, render
 from django.template.loader import render_to_string
 from django.urls import reverse
@@ -41,7 +41,15 @@ def _require_superuser(request) -> None:
 
 
 def _get_pointers() -> SystemConfigPointers:
-    obj, _ = SystemConfigPointers.objects.get_or_create(pk=1)
+    # Join all four active configs so reading them costs no extra queries.
+    obj = (
+        SystemConfigPointers.objects
+        .select_related("active_l1_config", "active_l2_config", "active_l3_config", "active_l4_config")
+        .filter(pk=1)
+        .first()
+    )
+    if obj is None:
+        obj, _ = SystemConfigPointers.objects.get_or_create(pk=1)
     return obj
 
 
@@ -448,9 +456,9 @@ def system_phase_contracts_home(request):
                 messages.error(request, "Invalid contract selection.")
                 return redirect("accounts:system_phase_contracts_home")
 
-            PhaseContract.objects.filter(key=contract.key).update(is_active=False)
-            contract.is_active = True
-            contract.save(update_fields=["is_active"])
+            PhaseContract.objects.filter(key=contract.key).update(
+                is_active=Case(When(pk=contract.pk, then=Value(True)), default=Value(False), output_field=BooleanField())
+            )
             messages.success(request, f"Activated {contract.key} v{contract.version}.")
             return redirect("accounts:system_phase_contracts_home")
 
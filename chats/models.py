@@ -7,6 +7,10 @@ from django.conf import settings
 from django.db import models, transaction
 from django.db.models import Q
 from django.db.models import Max
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from chats.services.turn_cache import clear_chat_turns
 
 
 class ChatWorkspace(models.Model):
@@ -423,3 +427,12 @@ class ContractText(models.Model):
 
     def __str__(self) -> str:
         return f"{self.scope_type}:{self.scope_project_id}:{self.scope_user_id}:{self.scope_id}:{self.key}:{self.status}"
+
+
+# Cached turn lists carry messages and their generated images; drop the chat's
+# entries whenever either changes (see chats/services/turn_cache.py).
+@receiver([post_save, post_delete], sender=ChatMessage, dispatch_uid="chats_turn_cache_message")
+@receiver([post_save, post_delete], sender="uploads.GeneratedImage", dispatch_uid="chats_turn_cache_image")
+def _clear_turn_cache(sender, instance, **kwargs):
+    if instance.chat_id:
+        clear_chat_turns(instance.chat_id)
@@ -9,7 +9,6 @@ import logging
 import os
 import re
 import urllib.request
-import anthropic
 from typing import Any, Callable, Dict, List, Optional
 
 from django.conf import settings
@@ -0,0 +1,42 @@
+# chats/services/turn_cache.py
+# -*- coding: utf-8 -*-
+"""
+Per-chat generation token for the cached turn list (see turns.py).
+
+Turn entries are keyed on the chat's current token. Clearing a chat drops its
+token, so the next render mints a new one and never sees the old entries,
+which simply expire. A render that raced a write stores under the old token
+and is never read.
+
+ChatMessage and GeneratedImage clear the token from post_save/post_delete
+(chats/models.py). bulk_create() and QuerySet.update() send no signals: code
+that writes messages or images that way must call clear_chat_turns() itself.
+
+Tokens must live in a cache shared by all workers (CACHES in settings), or a
+clear in one process would leave the others serving stale turns. A token the
+cache evicts is simply replaced, which only costs a rebuild.
+"""
+
+from __future__ import annotations
+
+import time
+
+from django.core.cache import cache
+
+
+def _generation_key(chat_id: int) -> str:
+    return f"turns_gen:{chat_id}"
+
+
+def turn_generation(chat_id: int) -> int:
+    key = _generation_key(chat_id)
+    token = cache.get(key)
+    if token is None:
+        # add() so concurrent first renders agree on one token.
+        cache.add(key, time.time_ns(), None)
+        token = cache.get(key)
+    return token if token is not None else time.time_ns()
+
+
+def clear_chat_turns(chat_id: int) -> None:
+    cache.delete(_generation_key(chat_id))
@@ -4,14 +4,76 @@
 from __future__ import annotations
 
 import json
+from collections import namedtuple
+from operator import itemgetter
 
+from django.core.cache import cache
+from django.db.models import Prefetch
 from django.utils import timezone
 
 from chats.models import ChatMessage
 from chats.services.llm import _extract_json_dict_from_text
+from chats.services.turn_cache import turn_generation
 from uploads.models import ChatAttachment, GeneratedImage
 
 
+# Columns read by the turn builder and the chat templates. segment_meta and
+# the attachment provider ids are never rendered, so they stay deferred.
+TURN_MESSAGE_FIELDS = (
+    "id",
+    "chat_id",
+    "sequence",
+    "role",
+    "importance",
+    "raw_text",
+    "answer_text",
+    "reasoning_text",
+    "output_text",
+    "created_at",
+)
+TURN_ATTACHMENT_FIELDS = (
+    "id",
+    "chat_id",
+    "file",
+    "original_name",
+    "content_type",
+    "size_bytes",
+    "created_at",
+)
+
+TURN_CACHE_TIMEOUT = 300
+
+# Lightweight stand-in for a ChatMessage inside turn dicts: carries only the
+# attributes templates read, keeps cache entries small and picklable.
+TurnMessage = namedtuple("TurnMessage", "id sequence raw_text importance created_at")
+
+
+def _turn_message(m) -> TurnMessage:
+    return TurnMessage(m.id, m.sequence, m.raw_text, getattr(m, "importance", "NORMAL"), m.created_at)
+
+
+def chat_attachments_prefetch() -> Prefetch:
+    """
+    Prefetch for ChatWorkspace querysets that render several chats, so
+    build_chat_turn_context reads attachments from the prefetch cache.
+    """
+    return Prefetch("attachments", queryset=ChatAttachment.objects.only(*TURN_ATTACHMENT_FIELDS))
+
+
+def _prefetched_or_query(chat, name: str, queryset):
+    # Reuse prefetch_related results when the caller supplied them.
+    if name in getattr(chat, "_prefetched_objects_cache", {}):
+        return list(getattr(chat, name).all())
+    return list(queryset)
+
+
+def _turn_cache_key(chat, show_system: bool) -> str:
+    # Built from the loaded chat plus the cache-held generation token: no
+    # query. The cursor is read from the same instance the builder uses.
+    cursor_id = int(getattr(chat, "pinned_cursor_message_id", 0) or 0)
+    return f"turns:{chat.pk}:{turn_generation(chat.pk)}:{cursor_id}:{int(show_system)}"
+
+
 def build_chat_turn_context(request, chat):
     """
     Turn definition (canonical):
@@ -19,28 +81,109 @@ def build_chat_turn_context(request, chat):
     - SYSTEM messages are not turns, but we can show them in the list
       as "events" (no turn number) for observability.
     - Handshake (ASSISTANT with no preceding USER) is not a turn
+
+    Callers rendering several chats should prefetch with
+    chat_attachments_prefetch(). Prefetched "messages" (ordered by
+    sequence, id) and "generated_images" (ordered by created_at, id) are
+    also honoured on a turn-cache miss.
+    """
+    attachments = _prefetched_or_query(
+        chat,
+        "attachments",
+        ChatAttachment.objects.filter(chat=chat).only(*TURN_ATTACHMENT_FIELDS),
+    )
+    show_system = request.GET.get("system") in ("1", "true", "yes")
+
+    cache_key = _turn_cache_key(chat, show_system)
+    items = cache.get(cache_key)
+    if items is None:
+        items = _assemble_turn_items(chat, show_system)
+        cache.set(cache_key, items, TURN_CACHE_TIMEOUT)
+
+    # Active selection (turn or system event)
+    selected_turn_id = request.GET.get("turn")
+    active_turn = None
+    if selected_turn_id:
+        # turn_id ("msg-"/"sys-"/"pending-") and legacy "seq-" ids never overlap.
+        by_id = {it["legacy_turn_id"]: it for it in items if it.get("legacy_turn_id")}
+        by_id.update((it["turn_id"], it) for it in items)
+        active_turn = by_id.get(selected_turn_id)
+    if active_turn is None and items:
+        active_turn = items[-1]
+    is_system_turn = bool(active_turn) and str(active_turn.get("turn_id", "")).startswith("sys-")
+    turn_sort, turn_dir = normalise_turn_sort(request)
+
+    # If user did not explicitly choose a sort, default to chronological
+    if "turn_sort" not in request.GET:
+        turn_sort = "updated"
+        turn_dir = "asc"
+
+    # "number" and "updated" are both chronological. Titles and created_at
+    # are always populated at assembly time, so plain getters suffice; the
+    # sort is stable, so equal keys keep the chronological order.
+    key_fn = itemgetter("title" if turn_sort == "title" else "created_at")
+    items.sort(key=key_fn, reverse=(turn_dir == "desc"))
+
+    # If no explicit selection, refresh active to latest TURN after sorting
+    if not selected_turn_id and items:
+        last_turn = None
+        for it in reversed(items):
+            if it.get("kind") == "turn":
+                last_turn = it
+                break
+        active_turn = last_turn or items[-1]
+        is_system_turn = bool(active_turn) and str(active_turn.get("turn_id", "")).startswith("sys-")
+
+    return {
+        "attachments": attachments,
+        "turn_items": items,
+        "turn_items_rev": items[::-1],
+        "active_turn": active_turn,
+        "turn_sort": turn_sort,
+        "turn_dir": turn_dir,
+        "is_system_turn": is_system_turn,
+        "show_system": show_system,
+    }
+
+
+def _assemble_turn_items(chat, show_system: bool):
     """
-    attachments = list(ChatAttachment.objects.filter(chat=chat))
-    generated_images = list(GeneratedImage.objects.filter(chat=chat).order_by("created_at", "id"))
+    Build numbered turn and SYSTEM event dicts for one chat, in chronological
+    (created_at, turn_id) order.
+    The result is independent of request sort/selection and is cached.
+    """
+    generated_images = _prefetched_or_query(
+        chat,
+        "generated_images",
+        GeneratedImage.objects.filter(chat=chat).order_by("created_at", "id"),
+    )
     images_by_message_id = {}
     for gi in generated_images:
         if gi.message_id:
             images_by_message_id.setdefault(gi.message_id, []).append(gi)
-    show_system = request.GET.get("system") in ("1", "true", "yes")
     cursor_id = int(getattr(chat, "pinned_cursor_message_id", 0) or 0)
+    # Every item gets a created_at so sorting can use a plain itemgetter;
+    # unsaved rows sort last, as they did with the old per-comparison now().
+    now_sentinel = timezone.now()
 
-    msg_list = list(
-        ChatMessage.objects.filter(chat=chat).order_by("sequence", "id")
-    )
+    msg_qs = ChatMessage.objects.filter(chat=chat).only(*TURN_MESSAGE_FIELDS)
+    if not show_system:
+        # Hidden SYSTEM events (rollups, seeds) are often the largest rows and
+        # never affect turn pairing, so keep them off the wire.
+        msg_qs = msg_qs.exclude(role=ChatMessage.Role.SYSTEM)
+    msg_list = _prefetched_or_query(chat, "messages", msg_qs.order_by("sequence", "id"))
 
     def _norm_role(v: str) -> str:
         return (v or "").upper().strip()
 
     def _preview(text: str, n: int = 60) -> str:
-        # 7-bit ASCII safe, force single-line preview
-        t = (text or "").replace("\r", " ").replace("\n", " ").strip()
-        while "  " in t:
-            t = t.replace("  ", " ")
+        # 7-bit ASCII safe, force single-line preview. Only a bounded head
+        # of the text can reach the preview, so cap the work before splitting.
+        raw = text or ""
+        t = " ".join(raw[: n * 4].split())
+        if len(t) <= n and len(raw) > n * 4:
+            # Whitespace-heavy head: collapse the full text instead.
+            t = " ".join(raw.split())
         return (t[:n] + "...") if len(t) > n else t
 
     def _coerce_text(value) -> str:
@@ -111,7 +254,7 @@ def build_chat_turn_context(request, chat):
                     "answer": "",
                     "reasoning": "",
                     "output": (m.raw_text or "").strip(),
-                    "created_at": m.created_at,
+                    "created_at": m.created_at or now_sentinel,
                     "title": _preview(m.raw_text or "(system)"),
                     "importance": getattr(m, "importance", "NORMAL"),
                     "is_pinned": getattr(m, "importance", "") == "PINNED",
@@ -155,14 +298,14 @@ def build_chat_turn_context(request, chat):
                 "turn_id": f"msg-{m.id}",
                 "legacy_turn_id": f"seq-{m.sequence}",
                 "kind": "turn",
-                "input": pending_user,
-                "assistant": m,
+                "input": _turn_message(pending_user),
+                "assistant": _turn_message(m),
                 "input_message_id": pending_user.id if pending_user else None,
                 "assistant_message_id": m.id,
                 "answer": answer,
                 "reasoning": reasoning,
                 "output": output,
-                "created_at": pending_user.created_at if pending_user else m.created_at,
+                "created_at": (pending_user.created_at if pending_user else m.created_at) or now_sentinel,
                 "title": _preview((pending_user.raw_text if pending_user else "") or "(no input)"),
                 "importance": getattr(m, "importance", "NORMAL"),
                 "is_pinned": (
@@ -187,14 +330,14 @@ def build_chat_turn_context(request, chat):
             "turn_id": f"pending-{pending_user.id}",
             "legacy_turn_id": "",
             "kind": "turn",
-            "input": pending_user,
+            "input": _turn_message(pending_user),
             "assistant": None,
             "input_message_id": pending_user.id,
             "assistant_message_id": None,
             "answer": "",
             "reasoning": "",
             "output": "",
-            "created_at": pending_user.created_at,
+            "created_at": pending_user.created_at or now_sentinel,
             "title": _preview(pending_user.raw_text or "(no input)"),
             "importance": getattr(pending_user, "importance", "NORMAL"),
             "is_pinned": getattr(pending_user, "importance", "") == "PINNED",
@@ -206,89 +349,17 @@ def build_chat_turn_context(request, chat):
         })
         pending_user = None
 
-    # Number turns (1..N) in chronological construction order
-    n = 0
-    for t in turns:
-        n += 1
+    # Turns are built in message order, so numbering in construction order is
+    # chronological; SYSTEM events stay blank.
+    for n, t in enumerate(turns, start=1):
         t["number"] = n
-
-    # Merge: SYSTEM events + turns, then sort by created_at/id for "right order"
+    for it in system_items:
+        it["number"] = ""
+    # Merge SYSTEM events with turns in chronological order; turn_id breaks
+    # ties so items sharing a timestamp keep a stable, repeatable order.
     items = system_items + turns
-    items = sorted(
-        items,
-        key=lambda x: (x.get("created_at") or timezone.now(), x.get("turn_id", "")),
-    )
-
-    # Re-number turns again after merge/sort; SYSTEM stays blank
-    n = 0
-    for it in items:
-        if it.get("kind") == "turn":
-            n += 1
-            it["number"] = n
-        else:
-            it["number"] = ""
-
-    # Active selection (turn or system event)
-    selected_turn_id = request.GET.get("turn")
-    active_turn = None
-    if selected_turn_id:
-        active_turn = next(
-            (
-                t
-                for t in items
-                if t.get("turn_id") == selected_turn_id
-                or t.get("legacy_turn_id") == selected_turn_id
-            ),
-            None,
-        )
-    if active_turn is None and items:
-        active_turn = items[-1]
-    is_system_turn = bool(active_turn) and str(active_turn.get("turn_id", "")).startswith("sys-")
-    turn_sort, turn_dir = normalise_turn_sort(request)
-
-    # If user did not explicitly choose a sort, default to chronological
-    if "turn_sort" not in request.GET:
-        turn_sort = "updated"
-        turn_dir = "asc"
-
-    key_map = {
-        "number": lambda x: (x.get("created_at") or timezone.now()),
-        "title": lambda x: (x.get("title") or ""),
-        "updated": lambda x: (x.get("created_at") or timezone.now()),
-    }
-    key_fn = key_map.get(turn_sort, key_map["updated"])
-    items = sorted(items, key=key_fn, reverse=(turn_dir == "desc"))
-
-    # If no explicit selection, refresh active to latest TURN after sorting
-    if not selected_turn_id and items:
-        last_turn = None
-        for it in reversed(items):
-            if it.get("kind") == "turn":
-                last_turn = it
-                break
-        active_turn = last_turn or items[-1]
-        is_system_turn = bool(active_turn) and str(active_turn.get("turn_id", "")).startswith("sys-")
-
-
-    # Re-number turns after user sort; SYSTEM stays blank
-    n = 0
-    # for it in items:
-    #     if it.get("kind") == "turn":
-    #         n += 1
-    #         it["number"] = n
-    #     else:
-    #         it["number"] = ""
-
-    return {
-        "attachments": attachments,
-        "turn_items": items,
-        "turn_items_rev": list(reversed(items)),
-        "active_turn": active_turn,
-        "turn_sort": turn_sort,
-        "turn_dir": turn_dir,
-        "is_system_turn": is_system_turn,
-        "show_system": show_system,
-    }
+    items.sort(key=itemgetter("created_at", "turn_id"))
+    return items
 
 
 def normalise_turn_sort(request):
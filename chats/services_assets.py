@@ -8,23 +8,29 @@ import hashlib
 import mimetypes
 import os
 import re
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from django.core.files.base import ContentFile
 
 from uploads.models import GeneratedImage
 
 
-_DATA_URL_RE = re.compile(
-    r"data:(image/[a-zA-Z0-9.+-]+);base64,([A-Za-z0-9+/=\s]+)",
-    re.IGNORECASE,
+# One scan recognises all three asset references: inline data URLs,
+# images API "b64_json" fields, and provider file ids.
+_ASSET_RE = re.compile(
+    r"(?i:data:(?P<data_mime>image/[a-zA-Z0-9.+-]+);base64,(?P<data_b64>[A-Za-z0-9+/=\s]+))"
+    r'|(?i:"b64_json"\s*:\s*"(?P<json_b64>[A-Za-z0-9+/=\s]+)")'
+    r"|\b(?P<file_id>file-[A-Za-z0-9_-]{6,})\b"
 )
-_FILE_ID_RE = re.compile(r"\b(file-[A-Za-z0-9_-]{6,})\b")
-_B64_JSON_RE = re.compile(r'"b64_json"\s*:\s*"([A-Za-z0-9+/=\s]+)"', re.IGNORECASE)
+_FILE_DOWNLOAD_WORKERS = 4
 
 
+@lru_cache(maxsize=32)
 def _ext_for_mime(mime_type: str) -> str:
-    ext = mimetypes.guess_extension((mime_type or "").strip().lower()) or ".png"
+    # Callers pass an already-normalised MIME type.
+    ext = mimetypes.guess_extension(mime_type) or ".png"
     if not ext.startswith("."):
         return "." + ext
     return ext
@@ -38,19 +44,24 @@ def save_generated_image_bytes(
     prompt: str,
     provider: str,
     model: str,
-    image_bytes: bytes,
+    image_bytes: bytes | memoryview,
     mime_type: str = "image/png",
     file_id: str = "",
     width: Optional[int] = None,
     height: Optional[int] = None,
 ) -> GeneratedImage:
-    data = bytes(image_bytes or b"")
+    # Avoid copying multi-MB payloads: hashlib reads bytes and memoryviews
+    # in place, and ContentFile's BytesIO takes the buffer directly.
+    if isinstance(image_bytes, (bytes, memoryview)):
+        data = image_bytes
+    else:
+        data = bytes(image_bytes or b"")
     if not data:
         raise ValueError("image_bytes is empty")
 
+    mime_norm = (mime_type or "image/png").strip().lower()
     sha = hashlib.sha256(data).hexdigest()
-    ext = _ext_for_mime(mime_type)
-    filename = sha + ext
+    filename = sha + _ext_for_mime(mime_norm)
 
     obj = GeneratedImage(
         project=project,
@@ -60,7 +71,7 @@ def save_generated_image_bytes(
         model=(model or "").strip(),
         prompt=prompt or "",
         file_id=(file_id or "").strip(),
-        mime_type=(mime_type or "image/png").strip().lower(),
+        mime_type=mime_norm,
         width=width,
         height=height,
         sha256=sha,
@@ -87,6 +98,23 @@ def download_provider_file_to_bytes(provider_file_id: str) -> bytes:
     raise ValueError("Unsupported file content response")
 
 
+def _safe_b64_decode(b64: str) -> Optional[bytes]:
+    # _ASSET_RE only captures base64 alphabet characters and whitespace; the
+    # non-validating decoder discards the whitespace itself, so there is no
+    # separate strip copy or alphabet re-scan before the C-level decode.
+    try:
+        return base64.b64decode(b64, validate=False)
+    except (ValueError, binascii.Error):
+        return None
+
+
+def _safe_download_provider_file(file_id: str) -> Tuple[str, Optional[bytes]]:
+    try:
+        return file_id, download_provider_file_to_bytes(file_id)
+    except Exception:
+        return file_id, None
+
+
 def persist_generated_images_from_text(
     *,
     project,
@@ -102,38 +130,24 @@ def persist_generated_images_from_text(
     if not raw.strip():
         return out
 
-    for match in _DATA_URL_RE.finditer(raw):
-        mime_type = (match.group(1) or "image/png").strip().lower()
-        b64 = re.sub(r"\s+", "", match.group(2) or "")
-        if not b64:
-            continue
-
-    for match in _B64_JSON_RE.finditer(raw):
-        b64 = re.sub(r"\s+", "", match.group(1) or "")
-        if not b64:
-            continue
-        try:
-            image_bytes = base64.b64decode(b64, validate=True)
-        except (ValueError, binascii.Error):
-            continue
-        try:
-            out.append(
-                save_generated_image_bytes(
-                    project=project,
-                    chat=chat,
-                    message=message,
-                    prompt=prompt,
-                    provider=provider,
-                    model=model,
-                    image_bytes=image_bytes,
-                    mime_type="image/png",
-                )
-            )
-        except Exception:
+    blobs: List[Tuple[str, str]] = []
+    file_ids: Dict[str, None] = {}
+    for match in _ASSET_RE.finditer(raw):
+        if match.group("file_id"):
+            file_ids.setdefault(match.group("file_id"), None)
             continue
-        try:
-            image_bytes = base64.b64decode(b64, validate=True)
-        except (ValueError, binascii.Error):
+        if match.group("data_b64") is not None:
+            mime_type = (match.group("data_mime") or "image/png").strip().lower()
+            b64 = match.group("data_b64") or ""
+        else:
+            mime_type = "image/png"
+            b64 = match.group("json_b64") or ""
+        if b64:
+            blobs.append((mime_type, b64))
+
+    for mime_type, b64 in blobs:
+        image_bytes = _safe_b64_decode(b64)
+        if not image_bytes:
             continue
         try:
             out.append(
@@ -151,28 +165,30 @@ def persist_generated_images_from_text(
         except Exception:
             continue
 
-    seen_file_ids = set()
-    for match in _FILE_ID_RE.finditer(raw):
-        file_id = (match.group(1) or "").strip()
-        if not file_id or file_id in seen_file_ids:
-            continue
-        seen_file_ids.add(file_id)
-        try:
-            image_bytes = download_provider_file_to_bytes(file_id)
-            out.append(
-                save_generated_image_bytes(
-                    project=project,
-                    chat=chat,
-                    message=message,
-                    prompt=prompt,
-                    provider=provider or "openai",
-                    model=model,
-                    image_bytes=image_bytes,
-                    mime_type="image/png",
-                    file_id=file_id,
+    # Provider downloads are network-bound; fetch them concurrently and
+    # persist on this thread so ORM writes stay on the request connection.
+    if file_ids:
+        workers = min(_FILE_DOWNLOAD_WORKERS, len(file_ids))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            downloads = list(pool.map(_safe_download_provider_file, list(file_ids)))
+        for file_id, image_bytes in downloads:
+            if not image_bytes:
+                continue
+            try:
+                out.append(
+                    save_generated_image_bytes(
+                        project=project,
+                        chat=chat,
+                        message=message,
+                        prompt=prompt,
+                        provider=provider or "openai",
+                        model=model,
+                        image_bytes=image_bytes,
+                        mime_type="image/png",
+                        file_id=file_id,
+                    )
                 )
-            )
-        except Exception:
-            continue
+            except Exception:
+                continue
 
     return out
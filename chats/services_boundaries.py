@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+from functools import lru_cache
 from typing import Any, Dict, List
 
 
@@ -28,16 +30,39 @@ def _split_topic_tags(raw: Any) -> List[str]:
         text = str(raw or "")
         text = text.replace(";", ",").replace("\n", ",")
         values = [v.strip().upper() for v in text.split(",")]
+    # Order matters: jurisdictions[0] is the primary jurisdiction.
+    seen = set()
     out: List[str] = []
     for v in values:
-        if not v:
-            continue
-        if v not in out:
+        if v and v not in seen:
+            seen.add(v)
             out.append(v)
     return out
 
 
+def _copy_profile(profile: Dict[str, Any]) -> Dict[str, Any]:
+    # Normalised profiles are one level deep; copy nested lists/dicts so
+    # callers can mutate the result without touching the cached entry.
+    return {
+        k: (list(v) if isinstance(v, list) else dict(v) if isinstance(v, dict) else v)
+        for k, v in profile.items()
+    }
+
+
+@lru_cache(maxsize=512)
+def _normalise_boundary_profile_cached(raw_json: str) -> Dict[str, Any]:
+    return _normalise_boundary_profile(json.loads(raw_json))
+
+
 def normalise_boundary_profile(raw: Dict[str, Any] | None) -> Dict[str, Any]:
+    try:
+        key = json.dumps(raw or {}, sort_keys=True)
+    except (TypeError, ValueError):
+        return _normalise_boundary_profile(raw)
+    return _copy_profile(_normalise_boundary_profile_cached(key))
+
+
+def _normalise_boundary_profile(raw: Dict[str, Any] | None) -> Dict[str, Any]:
     data = dict(raw or {})
     authority = dict(data.get("authority_set") or {})
     labels = dict(data.get("required_labels") or {})
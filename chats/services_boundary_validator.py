@@ -2,14 +2,11 @@
 
 from __future__ import annotations
 
+import re
 from typing import Any, Dict, List, Tuple
 
 
-def _has_label_line(text: str, label: str) -> bool:
-    for line in (text or "").splitlines():
-        if line.strip().lower().startswith(label.lower() + ":"):
-            return True
-    return False
+_LABEL_RE = re.compile(r"^\s*(scope|assumptions|source basis|confidence):", re.IGNORECASE | re.MULTILINE)
 
 
 def validate_boundary_labels(
@@ -22,14 +19,15 @@ def validate_boundary_labels(
     required = dict(profile.get("required_labels") or {})
     text = (model_text or "").strip()
     errors: List[str] = []
+    present = {m.group(1).lower() for m in _LABEL_RE.finditer(text)}
 
-    if required.get("scope_flag", True) and not _has_label_line(text, "Scope"):
+    if required.get("scope_flag", True) and "scope" not in present:
         errors.append("missing Scope")
-    if required.get("assumptions", True) and not _has_label_line(text, "Assumptions"):
+    if required.get("assumptions", True) and "assumptions" not in present:
         errors.append("missing Assumptions")
-    if required.get("source_basis", True) and not _has_label_line(text, "Source basis"):
+    if required.get("source_basis", True) and "source basis" not in present:
         errors.append("missing Source basis")
-    if required.get("confidence", True) and not _has_label_line(text, "Confidence"):
+    if required.get("confidence", True) and "confidence" not in present:
         errors.append("missing Confidence")
 
     excerpts = boundary_excerpts or []
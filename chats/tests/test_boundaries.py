@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 
 from chats.models import ChatWorkspace
-from chats.services_boundaries import is_boundary_profile_active, resolve_boundary_profile
+from chats.services_boundaries import (
+    is_boundary_profile_active,
+    normalise_boundary_profile,
+    resolve_boundary_profile,
+)
 from chats.services_boundary_validator import validate_boundary_labels
 from projects.models import Project
 
@@ -45,6 +49,18 @@ class BoundaryProfileResolveTests(TestCase):
         self.assertFalse(is_boundary_profile_active(out))
 
 
+class BoundaryProfileNormaliseTests(SimpleTestCase):
+    def test_cached_result_is_not_shared_between_callers(self):
+        raw = {"jurisdiction": "UK", "topic_tags": ["UK_TAX"]}
+        first = normalise_boundary_profile(raw)
+        first["topic_tags"].append("MUTATED")
+        first["authority_set"]["allow_public_sources"] = True
+
+        second = normalise_boundary_profile(dict(raw))
+        self.assertEqual(second["topic_tags"], ["UK_TAX"])
+        self.assertFalse(second["authority_set"]["allow_public_sources"])
+
+
 class BoundaryValidatorTests(TestCase):
     def test_validate_boundary_labels_pass_and_fail(self):
         profile = {
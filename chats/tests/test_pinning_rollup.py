@@ -15,18 +15,33 @@ from chats.services.pinning import (
 )
 from projects.models import Project
 
+UserModel = get_user_model()
+
+_STUB_ROLLUP_JSON = '{"summary":"s","conclusion":"c"}'
+
 
 class PinningRollupTests(TestCase):
-    def setUp(self):
-        User = get_user_model()
-        self.user = User.objects.create_user(username="pin_u", email="pin_u@example.com", password="pw")
-        self.project = Project.objects.create(name="Pinning Project", owner=self.user)
-        self.chat = ChatWorkspace.objects.create(
-            project=self.project,
+    @classmethod
+    def setUpTestData(cls):
+        # Created once per class; TestCase rolls back each test's writes and
+        # hands every test its own copy of these instances.
+        cls.user = UserModel.objects.create_user(username="pin_u", email="pin_u@example.com", password="pw")
+        cls.project = Project.objects.create(name="Pinning Project", owner=cls.user)
+        cls.chat = ChatWorkspace.objects.create(
+            project=cls.project,
             title="Pinning chat",
-            created_by=self.user,
+            created_by=cls.user,
         )
 
+    def _reload_chat_min(self):
+        # The rollup tests only assert on the pinned-* columns.
+        return ChatWorkspace.objects.only(
+            "id",
+            "pinned_cursor_message_id",
+            "pinned_summary",
+            "pinned_conclusion",
+        ).get(pk=self.chat.pk)
+
     def _mk_turn(self, idx: int):
         u = ChatMessage.objects.create(
             chat=self.chat,
@@ -41,9 +56,31 @@ class PinningRollupTests(TestCase):
         )
         return u, a
 
+    def _mk_turns(self, n: int):
+        # bulk_create bypasses ChatMessage.save(), so assign sequences here.
+        msgs = []
+        for i in range(n):
+            msgs.append(
+                ChatMessage(
+                    chat=self.chat,
+                    sequence=2 * i + 1,
+                    role=ChatMessage.Role.USER,
+                    raw_text=f"user-{i}",
+                )
+            )
+            msgs.append(
+                ChatMessage(
+                    chat=self.chat,
+                    sequence=2 * i + 2,
+                    role=ChatMessage.Role.ASSISTANT,
+                    raw_text=f"assistant-{i}",
+                    answer_text=f"assistant-{i}",
+                )
+            )
+        ChatMessage.objects.bulk_create(msgs)
+
     def test_auto_rollup_triggers_at_20_messages(self):
-        for i in range(10):
-            self._mk_turn(i)
+        self._mk_turns(10)
         self.assertTrue(should_auto_rollup(self.chat))
 
     def test_auto_rollup_uses_user_threshold(self):
@@ -51,23 +88,22 @@ class PinningRollupTests(TestCase):
         profile.summary_rollup_trigger_message_count = 6
         profile.save(update_fields=["summary_rollup_trigger_message_count"])
 
-        for i in range(2):
-            self._mk_turn(i)
+        self._mk_turns(2)
         self.assertFalse(should_auto_rollup(self.chat, user=self.user))
 
         self._mk_turn(3)
         self.assertTrue(should_auto_rollup(self.chat, user=self.user))
 
-    def test_manual_pin_advances_cursor_immediately(self):
+    @patch("chats.services.pinning.generate_text", return_value=_STUB_ROLLUP_JSON)
+    def test_manual_pin_advances_cursor_immediately(self, _mock_generate):
         u1, a1 = self._mk_turn(1)
         u2, a2 = self._mk_turn(2)
         u2.importance = ChatMessage.Importance.PINNED
         u2.save(update_fields=["importance"])
 
-        with patch("chats.services.pinning.generate_text", return_value='{"summary":"s","conclusion":"c"}'):
-            rollup_segment(self.chat, upto_message_id=u2.id, user=self.user)
+        rollup_segment(self.chat, upto_message_id=u2.id, user=self.user)
 
-        self.chat.refresh_from_db()
+        self.chat = self._reload_chat_min()
         self.assertEqual(self.chat.pinned_cursor_message_id, u2.id)
         self.assertEqual(self.chat.pinned_summary, "s")
         self.assertEqual(self.chat.pinned_conclusion, "c")
@@ -81,15 +117,16 @@ class PinningRollupTests(TestCase):
         a1.importance = ChatMessage.Importance.IGNORE
         a1.save(update_fields=["raw_text", "answer_text", "importance"])
 
-        def _fake_generate_text(*, system_blocks, messages, user=None, provider=None, **kwargs):
-            payload = messages[0]["content"]
-            self.assertNotIn("IGNORE-ME", payload)
-            return '{"summary":"ok","conclusion":"ok"}'
-
-        with patch("chats.services.pinning.generate_text", side_effect=_fake_generate_text):
+        with patch(
+            "chats.services.pinning.generate_text",
+            return_value='{"summary":"ok","conclusion":"ok"}',
+        ) as mock_generate:
             rollup_segment(self.chat, user=self.user)
 
-        self.chat.refresh_from_db()
+        payload = mock_generate.call_args.kwargs["messages"][0]["content"]
+        self.assertNotIn("IGNORE-ME", payload)
+
+        self.chat = self._reload_chat_min()
         self.assertEqual(self.chat.pinned_summary, "ok")
 
     def test_quick_mode_uses_only_previous_turn(self):
@@ -97,7 +134,8 @@ class PinningRollupTests(TestCase):
         self._mk_turn(2)
         self._mk_turn(3)
 
-        history = build_history_messages(self.chat, answer_mode="quick")
+        with self.assertNumQueries(1):
+            history = build_history_messages(self.chat, answer_mode="quick")
         self.assertEqual(len(history), 2)
         self.assertIn("user-3", history[0]["content"][0]["text"])
         self.assertIn("assistant-3", history[1]["content"][0]["text"])
@@ -109,7 +147,8 @@ class PinningRollupTests(TestCase):
         self.chat.pinned_cursor_message_id = a1.id
         self.chat.save(update_fields=["pinned_cursor_message_id"])
 
-        history = build_history_messages(self.chat, answer_mode="full")
+        with self.assertNumQueries(1):
+            history = build_history_messages(self.chat, answer_mode="full")
         self.assertEqual(len(history), 4)
         self.assertIn("user-2", history[0]["content"][0]["text"])
         self.assertIn("assistant-3", history[-1]["content"][0]["text"])
@@ -119,28 +158,30 @@ class PinningRollupTests(TestCase):
         self.chat.pinned_conclusion = "Short conclusion."
         self.chat.save(update_fields=["pinned_summary", "pinned_conclusion"])
 
-        block = build_pinned_system_block(self.chat)
+        # Reads only fields already on the instance.
+        with self.assertNumQueries(0):
+            block = build_pinned_system_block(self.chat)
         self.assertIn("Summary:", block)
         self.assertIn("Conclusion:", block)
         self.assertIn("point one", block)
         self.assertIn("Short conclusion.", block)
 
-    def test_undo_last_rollup_restores_previous_state(self):
+    @patch("chats.services.pinning.generate_text", return_value=_STUB_ROLLUP_JSON)
+    def test_undo_last_rollup_restores_previous_state(self, _mock_generate):
         self.chat.pinned_summary = "before-s"
         self.chat.pinned_conclusion = "before-c"
         self.chat.pinned_cursor_message_id = 1
         self.chat.save(update_fields=["pinned_summary", "pinned_conclusion", "pinned_cursor_message_id"])
 
         _u, a = self._mk_turn(1)
-        with patch("chats.services.pinning.generate_text", return_value='{"summary":"after-s","conclusion":"after-c"}'):
-            rollup_segment(self.chat, user=self.user)
+        rollup_segment(self.chat, user=self.user)
 
-        self.chat.refresh_from_db()
-        self.assertEqual(self.chat.pinned_summary, "after-s")
+        self.chat = self._reload_chat_min()
+        self.assertEqual(self.chat.pinned_summary, "s")
 
         res = undo_last_rollup(self.chat, user=self.user)
         self.assertTrue(res.get("undone"))
-        self.chat.refresh_from_db()
+        self.chat = self._reload_chat_min()
         self.assertEqual(self.chat.pinned_summary, "before-s")
         self.assertEqual(self.chat.pinned_conclusion, "before-c")
         self.assertEqual(self.chat.pinned_cursor_message_id, 1)
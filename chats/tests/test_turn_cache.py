@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+
+from chats.models import ChatMessage, ChatWorkspace
+from chats.services.turns import build_chat_turn_context
+from projects.models import Project
+
+UserModel = get_user_model()
+
+
+class TurnCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserModel.objects.create_user(username="turn_u", email="turn_u@example.com", password="pw")
+        cls.project = Project.objects.create(name="Turn Cache Project", owner=cls.user)
+        cls.chat = ChatWorkspace.objects.create(project=cls.project, title="Turn chat", created_by=cls.user)
+
+    def setUp(self):
+        # pks are reused after rollback, so never let a previous test's
+        # entries answer for this one.
+        cache.clear()
+        self.request = RequestFactory().get("/")
+
+    def _mk_turn(self, idx: int):
+        ChatMessage.objects.create(chat=self.chat, role=ChatMessage.Role.USER, raw_text=f"user-{idx}")
+        return ChatMessage.objects.create(
+            chat=self.chat,
+            role=ChatMessage.Role.ASSISTANT,
+            raw_text=f"assistant-{idx}",
+            answer_text=f"answer-{idx}",
+        )
+
+    def _answered_turn_count(self) -> int:
+        ctx = build_chat_turn_context(self.request, self.chat)
+        return sum(1 for it in ctx["turn_items"] if it.get("assistant_message_id"))
+
+    def test_cached_render_only_queries_attachments(self):
+        self._mk_turn(1)
+        self._answered_turn_count()
+        with self.assertNumQueries(1):
+            self.assertEqual(self._answered_turn_count(), 1)
+
+    def test_message_save_invalidates(self):
+        self._mk_turn(1)
+        self.assertEqual(self._answered_turn_count(), 1)
+        self._mk_turn(2)
+        self.assertEqual(self._answered_turn_count(), 2)
+
+    def test_message_delete_invalidates(self):
+        self._mk_turn(1)
+        last = self._mk_turn(2)
+        self.assertEqual(self._answered_turn_count(), 2)
+        ChatMessage.objects.filter(pk=last.pk).delete()
+        self.assertEqual(self._answered_turn_count(), 1)
@@ -3,6 +3,9 @@
 
 from django import forms
 from django.contrib import admin
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 from .models import ConfigScope, ConfigRecord, ConfigVersion
 
@@ -12,6 +15,43 @@ from .models import ConfigScope, ConfigRecord, ConfigVersion
 # Guides valid Level ↔ Scope combinations
 # ============================================================
 
+_SCOPE_TYPES_BY_LEVEL = {
+    ConfigRecord.Level.L1: (ConfigScope.ScopeType.USER, ConfigScope.ScopeType.ORG),
+    ConfigRecord.Level.L2: (ConfigScope.ScopeType.ORG,),
+    ConfigRecord.Level.L3: (ConfigScope.ScopeType.ORG,),
+    ConfigRecord.Level.L4: (ConfigScope.ScopeType.PROJECT, ConfigScope.ScopeType.SESSION),
+}
+
+
+def _scope_choices(*scope_types):
+    # ConfigScope.__str__ only reads these columns, so the select widget
+    # never needs the rest of the row or a join.
+    return ConfigScope.objects.filter(scope_type__in=scope_types).only(
+        "id", "scope_type", "project", "user", "session_id"
+    )
+
+
+_SCOPE_CHOICES_CACHE_TIMEOUT = 300
+
+
+def _scope_choices_cache_key(scope_types) -> str:
+    return "config:scope_choices:" + ",".join(sorted(scope_types))
+
+
+def _cached_scope_choices(scope_types) -> list[tuple[int, str]]:
+    key = _scope_choices_cache_key(scope_types)
+    choices = cache.get(key)
+    if choices is None:
+        choices = [(s.pk, str(s)) for s in _scope_choices(*scope_types)]
+        cache.set(key, choices, _SCOPE_CHOICES_CACHE_TIMEOUT)
+    return choices
+
+
+@receiver([post_save, post_delete], sender=ConfigScope, dispatch_uid="config_admin_scope_choices")
+def _clear_scope_choices_cache(sender, **kwargs):
+    cache.delete_many([_scope_choices_cache_key(t) for t in _SCOPE_TYPES_BY_LEVEL.values()])
+
+
 class ConfigRecordAdminForm(forms.ModelForm):
     class Meta:
         model = ConfigRecord
@@ -27,31 +67,14 @@ class ConfigRecordAdminForm(forms.ModelForm):
             return
 
         # Restrict scope choices based on level
-        if level == ConfigRecord.Level.L1:
-            self.fields["scope"].queryset = ConfigScope.objects.filter(
-                scope_type__in=[
-                    ConfigScope.ScopeType.USER,
-                    ConfigScope.ScopeType.ORG,
-                ]
-            )
-
-        elif level == ConfigRecord.Level.L2:
-            self.fields["scope"].queryset = ConfigScope.objects.filter(
-                scope_type=ConfigScope.ScopeType.ORG
-            )
-
-        elif level == ConfigRecord.Level.L3:
-            self.fields["scope"].queryset = ConfigScope.objects.filter(
-                scope_type=ConfigScope.ScopeType.ORG
-            )
-
-        elif level == ConfigRecord.Level.L4:
-            self.fields["scope"].queryset = ConfigScope.objects.filter(
-                scope_type__in=[
-                    ConfigScope.ScopeType.PROJECT,
-                    ConfigScope.ScopeType.SESSION,
-                ]
-            )
+        allowed = _SCOPE_TYPES_BY_LEVEL.get(level)
+        if allowed:
+            field = self.fields["scope"]
+            # The queryset is still used to validate the submitted value; the
+            # <select> options come from the cache instead of a fresh SELECT.
+            field.queryset = _scope_choices(*allowed)
+            blank = [("", field.empty_label)] if field.empty_label is not None else []
+            field.choices = blank + _cached_scope_choices(allowed)
 
 
 # ============================================================
@@ -61,6 +84,7 @@ class ConfigRecordAdminForm(forms.ModelForm):
 @admin.register(ConfigScope)
 class ConfigScopeAdmin(admin.ModelAdmin):
     list_display = ("scope_type", "project", "user", "session_id")
+    list_select_related = ("project", "user")
     list_filter = ("scope_type",)
     search_fields = ("project__name", "user__username", "session_id")
     autocomplete_fields = ("project", "user")
@@ -75,6 +99,8 @@ class ConfigRecordAdmin(admin.ModelAdmin):
     form = ConfigRecordAdminForm
 
     list_display = ("file_id", "level", "scope", "status", "created_at")
+    # ConfigRecord.__str__ reads scope; join it up front.
+    list_select_related = ("scope",)
     list_filter = ("level", "status")
     search_fields = ("file_id", "file_name")
     autocomplete_fields = ("created_by",)
@@ -97,6 +123,10 @@ class ConfigRecordAdmin(admin.ModelAdmin):
 
     readonly_fields = ("created_at",)
 
+    def get_queryset(self, request):
+        # Also used by the ConfigVersion autocomplete, which renders __str__.
+        return super().get_queryset(request).select_related(*self.list_select_related)
+
 
 # ============================================================
 # ConfigVersion Admin
@@ -105,6 +135,7 @@ class ConfigRecordAdmin(admin.ModelAdmin):
 @admin.register(ConfigVersion)
 class ConfigVersionAdmin(admin.ModelAdmin):
     list_display = ("config", "version", "created_by", "created_at")
+    list_select_related = ("config__scope", "created_by")
     list_filter = ("config",)
     search_fields = ("config__file_id", "version")
     autocomplete_fields = ("config", "created_by")
@@ -0,0 +1,17 @@
+# Generated by Django 6.0.1 on 2026-10-17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("config", "0005_systemconfigpointers_anthropic_model_default"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="configrecord",
+            index=models.Index(fields=["scope", "level", "-created_at"], name="cfg_scope_level_created"),
+        ),
+    ]
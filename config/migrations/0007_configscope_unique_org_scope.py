@@ -0,0 +1,65 @@
+# Generated by Django 6.0.1 on 2026-10-17
+
+from django.db import migrations, models
+
+
+def merge_duplicate_org_scopes(apps, schema_editor):
+    """
+    Workers racing on a cold boot could insert several ORG scopes. Keep the
+    lowest pk, move everything that points at the others onto it, then delete
+    the extras so the partial unique constraint can be added.
+    """
+    ConfigScope = apps.get_model("config", "ConfigScope")
+    ConfigRecord = apps.get_model("config", "ConfigRecord")
+
+    org_ids = list(
+        ConfigScope.objects.filter(scope_type="ORG").order_by("pk").values_list("pk", flat=True)
+    )
+    if len(org_ids) < 2:
+        return
+    keeper_id, dup_ids = org_ids[0], org_ids[1:]
+
+    # ConfigRecord is unique on (level, file_id, scope): a record that would
+    # collide with one already on the keeper gets a suffixed file_id instead
+    # of being dropped, so no config or version history is lost.
+    taken = set(
+        ConfigRecord.objects.filter(scope_id=keeper_id).values_list("level", "file_id")
+    )
+    for rec in ConfigRecord.objects.filter(scope_id__in=dup_ids).order_by("pk"):
+        if (rec.level, rec.file_id) in taken:
+            suffix = f"~dup{rec.pk}"
+            rec.file_id = rec.file_id[: 120 - len(suffix)] + suffix
+        rec.scope_id = keeper_id
+        rec.save(update_fields=["scope", "file_id"])
+        taken.add((rec.level, rec.file_id))
+
+    # Any other relation to ConfigScope (none today) is repointed wholesale.
+    for rel in ConfigScope._meta.related_objects:
+        if rel.related_model is ConfigRecord or not rel.field.many_to_one:
+            continue
+        rel.related_model.objects.filter(**{f"{rel.field.name}_id__in": dup_ids}).update(
+            **{f"{rel.field.name}_id": keeper_id}
+        )
+
+    ConfigScope.objects.filter(pk__in=dup_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("config", "0006_configrecord_cfg_scope_level_created"),
+    ]
+
+    operations = [
+        # Irreversible by nature: merged duplicates are not split back out on
+        # rollback, which only removes the constraint.
+        migrations.RunPython(merge_duplicate_org_scopes, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="configscope",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("scope_type", "ORG")),
+                fields=("scope_type",),
+                name="unique_org_scope",
+            ),
+        ),
+    ]
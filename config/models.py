@@ -52,6 +52,14 @@ class ConfigScope(models.Model):
             models.Index(fields=["project"]),
             models.Index(fields=["user"]),
         ]
+        constraints = [
+            # ORG is a singleton; stops racing get_or_create calls inserting two.
+            models.UniqueConstraint(
+                fields=["scope_type"],
+                condition=models.Q(scope_type="ORG"),
+                name="unique_org_scope",
+            ),
+        ]
 
     def __str__(self) -> str:
         if self.scope_type == self.ScopeType.ORG:
@@ -116,18 +124,31 @@ class ConfigRecord(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
+        # Also the composite index for (level, file_id, scope) lookups such as
+        # seed_system_configs; no separate Index is needed for them.
         unique_together = [("level", "file_id", "scope")]
         indexes = [
             models.Index(fields=["level", "status"]),
             models.Index(fields=["file_id"]),
+            # Per-scope browse lists: filter (scope, level), newest first.
+            models.Index(fields=["scope", "level", "-created_at"], name="cfg_scope_level_created"),
         ]
 
     def clean(self) -> None:
         """
         Enforce valid Level ↔ Scope combinations.
         """
+        self._validate_scope()
+
+    def _validate_scope(self) -> None:
+        """
+        Level ↔ Scope matrix check shared by clean() and save().
+
+        Pure Python apart from loading self.scope if it is not cached yet;
+        call it explicitly on instances before objects.bulk_create().
+        """
 
-        if not self.scope:
+        if self.scope_id is None:
             raise ValidationError({"scope": "Scope is required for all configuration records."})
 
         # IMPORTANT: Updated to support:
@@ -174,16 +195,20 @@ class ConfigRecord(models.Model):
                 raise ValidationError({"scope": "SESSION scope requires session_id only."})
 
     def save(self, *args, **kwargs) -> None:
-        # Enforce semantic validation everywhere (admin, scripts, services)
-        self.full_clean()
+        # Enforce the Level ↔ Scope rules everywhere (admin, scripts, services).
+        # Field and uniqueness checks stay with ModelForms at the UI boundary;
+        # the DB unique constraint still backs unique_together here.
+        self._validate_scope()
         super().save(*args, **kwargs)
 
     def __str__(self) -> str:
+        # Uses the scope's FK ids only, so formatting never loads project/user;
+        # select_related("scope") at the call site makes it query-free.
         scope = self.scope.scope_type
         if scope == ConfigScope.ScopeType.PROJECT:
-            scope = f"Project: {self.scope.project}"
+            scope = f"Project: {self.scope.project_id}"
         elif scope == ConfigScope.ScopeType.USER:
-            scope = f"User: {self.scope.user}"
+            scope = f"User: {self.scope.user_id}"
         elif scope == ConfigScope.ScopeType.SESSION:
             scope = f"Session: {self.scope.session_id}"
         return f"{self.file_id} ({scope})"
@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class ConfigUiConfig(AppConfig):
     name = 'config_ui'
+
+    def ready(self):
+        # Register the ORG scope cache invalidation in views_system.
+        from . import views_system  # noqa: F401
@@ -1,3 +1,25 @@
+from django.core.cache import cache
 from django.test import TestCase
 
-# Create your tests here.
+from config.models import ConfigScope
+from config_ui.views_system import _get_org_scope_id
+
+
+class OrgScopeIdCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_cached_after_first_lookup(self):
+        # A newly created row is only cached once its transaction commits.
+        with self.captureOnCommitCallbacks(execute=True):
+            scope_id = _get_org_scope_id()
+        with self.assertNumQueries(0):
+            self.assertEqual(_get_org_scope_id(), scope_id)
+
+    def test_deleting_org_scope_clears_cached_id(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            old_id = _get_org_scope_id()
+        ConfigScope.objects.get(pk=old_id).delete()
+        new_id = _get_org_scope_id()
+        self.assertNotEqual(new_id, old_id)
+        self.assertTrue(ConfigScope.objects.filter(pk=new_id, scope_type=ConfigScope.ScopeType.ORG).exists())
@@ -5,9 +5,16 @@ from __future__ import annotations
 
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Prefetch
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.http import Http404
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
+from django.utils import timezone
 
 from config.models import ConfigRecord, ConfigScope, ConfigVersion, SystemConfigPointers
 
@@ -17,39 +24,71 @@ def _require_superuser(request) -> None:
         raise Http404()
 
 
+_POINTER_FIELDS = ("active_l1_config", "active_l2_config", "active_l3_config", "active_l4_config")
+
+
 def _get_pointers() -> SystemConfigPointers:
-    obj, _ = SystemConfigPointers.objects.get_or_create(pk=1)
+    # Join the active configs up front; every caller reads at least one of
+    # them, which would otherwise cost a query per pointer.
+    obj = SystemConfigPointers.objects.select_related(*_POINTER_FIELDS).filter(pk=1).first()
+    if obj is None:
+        obj, _ = SystemConfigPointers.objects.get_or_create(pk=1)
     return obj
 
 
-def _get_org_scope() -> ConfigScope:
-    # ORG scope should have no project/user and empty session_id
-    obj, _ = ConfigScope.objects.get_or_create(
+_ORG_SCOPE_CACHE_KEY = "config_ui:org_scope_id"
+_ORG_SCOPE_CACHE_TIMEOUT = 300
+
+
+def _get_org_scope_id() -> int:
+    # ORG scope should have no project/user and empty session_id.
+    # Callers only need its pk as a scope_id filter/FK value.
+    scope_id = cache.get(_ORG_SCOPE_CACHE_KEY)
+    if scope_id is not None:
+        return scope_id
+    obj, created = ConfigScope.objects.get_or_create(
         scope_type=ConfigScope.ScopeType.ORG,
-        project=None,
-        user=None,
-        session_id="",
+        defaults={"project": None, "user": None, "session_id": ""},
     )
-    return obj
+    if created:
+        # A fresh row only becomes shareable once its transaction commits.
+        transaction.on_commit(lambda: cache.set(_ORG_SCOPE_CACHE_KEY, obj.pk, _ORG_SCOPE_CACHE_TIMEOUT))
+    else:
+        cache.set(_ORG_SCOPE_CACHE_KEY, obj.pk, _ORG_SCOPE_CACHE_TIMEOUT)
+    return obj.pk
+
+
+@receiver([post_save, post_delete], sender=ConfigScope, dispatch_uid="config_ui_org_scope_id")
+def _clear_org_scope_id(sender, instance, **kwargs):
+    if instance.scope_type == ConfigScope.ScopeType.ORG:
+        cache.delete(_ORG_SCOPE_CACHE_KEY)
+
+
+_POINTER_FIELD_BY_LEVEL = dict(zip((1, 2, 3, 4), _POINTER_FIELDS))
+_LEVEL_LABELS = {int(lvl): lvl.label for lvl in ConfigRecord.Level}
 
 
 def _pointer_field_for_level(level: int) -> str:
-    mapping = {
-        1: "active_l1_config",
-        2: "active_l2_config",
-        3: "active_l3_config",
-        4: "active_l4_config",
-    }
-    if level not in mapping:
+    try:
+        return _POINTER_FIELD_BY_LEVEL[level]
+    except KeyError:
         raise Http404("Invalid level.")
-    return mapping[level]
 
 
 def _level_label(level: int) -> str:
-    try:
-        return ConfigRecord.Level(level).label
-    except Exception:
-        return f"Level {level}"
+    return _LEVEL_LABELS.get(level, f"Level {level}")
+
+
+def _set_active_pointer(level: int, cfg: ConfigRecord, user) -> None:
+    # Write-only: nothing on the pointers row is read first, so a single
+    # UPDATE is enough (updated_at set by hand as update() skips auto_now).
+    values = {
+        _pointer_field_for_level(level): cfg,
+        "updated_by": user,
+        "updated_at": timezone.now(),
+    }
+    if not SystemConfigPointers.objects.filter(pk=1).update(**values):
+        SystemConfigPointers.objects.create(pk=1, **values)
 
 
 def _latest_version_for(cfg: ConfigRecord) -> ConfigVersion | None:
@@ -75,13 +114,17 @@ def system_home(request):
     ]
 
     # Helpful counts per level (ORG only)
-    org_scope = _get_org_scope()
-    counts = {
-        1: ConfigRecord.objects.filter(level=1, scope=org_scope).count(),
-        2: ConfigRecord.objects.filter(level=2, scope=org_scope).count(),
-        3: ConfigRecord.objects.filter(level=3, scope=org_scope).count(),
-        4: ConfigRecord.objects.filter(level=4, scope=org_scope).count(),
-    }
+    org_scope_id = _get_org_scope_id()
+    counts = {1: 0, 2: 0, 3: 0, 4: 0}
+    level_counts = (
+        ConfigRecord.objects
+        .filter(scope_id=org_scope_id, level__in=counts)
+        .values("level")
+        .annotate(n=Count("id"))
+        .order_by()
+    )
+    for row in level_counts:
+        counts[row["level"]] = row["n"]
 
     return render(
         request,
@@ -100,22 +143,23 @@ def system_level_browse(request, level: int):
     if level not in (1, 2, 3, 4):
         raise Http404()
 
-    org_scope = _get_org_scope()
+    org_scope_id = _get_org_scope_id()
     pointers = _get_pointers()
     pointer_field = _pointer_field_for_level(level)
     current = getattr(pointers, pointer_field)
 
+    # Newest version per config via a sliced Prefetch: Django turns the [:1]
+    # into one ROW_NUMBER() query over all configs (DISTINCT ON would tie
+    # this to Postgres), so the page is two queries regardless of size.
+    latest_qs = ConfigVersion.objects.only("id", "config_id", "version", "created_at").order_by("-created_at")
     configs = (
         ConfigRecord.objects
-        .select_related("scope")
-        .filter(level=level, scope=org_scope)
+        .filter(level=level, scope_id=org_scope_id)
+        .only("id", "level", "file_id", "file_name", "display_name", "status", "created_at")
+        .prefetch_related(Prefetch("versions", queryset=latest_qs[:1], to_attr="_latest_list"))
         .order_by("-created_at")
     )
-
-    rows = []
-    for c in configs:
-        latest = _latest_version_for(c)
-        rows.append((c, latest))
+    rows = [(c, c._latest_list[0] if c._latest_list else None) for c in configs]
 
     return render(
         request,
@@ -136,7 +180,7 @@ def system_config_create(request, level: int):
     if level not in (1, 2, 3, 4):
         raise Http404()
 
-    org_scope = _get_org_scope()
+    org_scope_id = _get_org_scope_id()
 
     if request.method == "POST":
         file_id = (request.POST.get("file_id") or "").strip()
@@ -149,30 +193,29 @@ def system_config_create(request, level: int):
             messages.error(request, "file_id and file_name are required.")
             return redirect(reverse("config_ui:system_config_create", args=[level]))
 
-        if ConfigRecord.objects.filter(level=level, file_id=file_id, scope=org_scope).exists():
-            messages.error(request, "That file_id already exists for this level at ORG scope.")
-            return redirect(reverse("config_ui:system_config_create", args=[level]))
-
         if status not in {ConfigRecord.Status.ACTIVE, ConfigRecord.Status.INACTIVE}:
             messages.error(request, "Invalid status.")
             return redirect(reverse("config_ui:system_config_create", args=[level]))
 
-        cfg = ConfigRecord.objects.create(
-            level=level,
-            file_id=file_id,
-            file_name=file_name,
-            display_name=display_name,
-            scope=org_scope,
-            status=status,
-            created_by=request.user,
-        )
+        # unique_together (level, file_id, scope) does the duplicate check in
+        # the INSERT itself; no separate exists() round trip or race window.
+        try:
+            with transaction.atomic():
+                cfg = ConfigRecord.objects.create(
+                    level=level,
+                    file_id=file_id,
+                    file_name=file_name,
+                    display_name=display_name,
+                    scope_id=org_scope_id,
+                    status=status,
+                    created_by=request.user,
+                )
+        except IntegrityError:
+            messages.error(request, "That file_id already exists for this level at ORG scope.")
+            return redirect(reverse("config_ui:system_config_create", args=[level]))
 
         if make_active:
-            pointers = _get_pointers()
-            pointer_field = _pointer_field_for_level(level)
-            setattr(pointers, pointer_field, cfg)
-            pointers.updated_by = request.user
-            pointers.save(update_fields=[pointer_field, "updated_by", "updated_at"])
+            _set_active_pointer(level, cfg, request.user)
             messages.success(request, f"{_level_label(level)} config created and set active.")
         else:
             messages.success(request, f"{_level_label(level)} config created.")
@@ -203,13 +246,8 @@ def system_set_active(request, config_id: int):
     if cfg.scope.scope_type != ConfigScope.ScopeType.ORG:
         raise Http404()
 
-    level = int(cfg.level)
-    pointer_field = _pointer_field_for_level(level)
-
-    pointers = _get_pointers()
-    setattr(pointers, pointer_field, cfg)
-    pointers.updated_by = request.user
-    pointers.save(update_fields=[pointer_field, "updated_by", "updated_at"])
+    level = cfg.level
+    _set_active_pointer(level, cfg, request.user)
 
     messages.success(request, f"{_level_label(level)} active config set.")
     return redirect(reverse("config_ui:system_level_browse", args=[level]))
@@ -223,16 +261,20 @@ def system_config_detail(request, config_id: int):
     if cfg.scope.scope_type != ConfigScope.ScopeType.ORG:
         raise Http404()
 
+    # The list only shows version/when/by; only the latest row's body and
+    # note are rendered, so fetch that one in full separately.
     versions = (
         ConfigVersion.objects
         .filter(config=cfg)
         .select_related("created_by")
+        .only("id", "config_id", "version", "created_at", "created_by")
         .order_by("-created_at")
     )
-    latest = versions.first()
+    latest = ConfigVersion.objects.filter(config=cfg).order_by("-created_at").first()
+    page_obj = Paginator(versions, 50).get_page(request.GET.get("page"))
 
     pointers = _get_pointers()
-    pointer_field = _pointer_field_for_level(int(cfg.level))
+    pointer_field = _pointer_field_for_level(cfg.level)
     active_cfg = getattr(pointers, pointer_field)
     is_active = bool(active_cfg and active_cfg.id == cfg.id)
 
@@ -241,20 +283,23 @@ def system_config_detail(request, config_id: int):
         "config_ui/system/system_config_detail.html",
         {
             "cfg": cfg,
-            "versions": versions,
+            "versions": page_obj,
+            "page_obj": page_obj,
             "latest": latest,
             "is_active": is_active,
         },
     )
 
 
+# (display form, lowercased form) for the case-insensitive L4 check.
+_REQUIRED_L4_MARKERS = tuple(
+    (m, m.lower()) for m in ("British English", "Reasoning hidden", "Be brief")
+)
+
+
 def _validate_l4_minimal(content_text: str) -> list[str]:
-    required_markers = [
-        "British English",
-        "Reasoning hidden",
-        "Be brief",
-    ]
-    return [m for m in required_markers if m.lower() not in content_text.lower()]
+    content_lower = content_text.lower()
+    return [m for m, m_lower in _REQUIRED_L4_MARKERS if m_lower not in content_lower]
 
 
 @login_required
@@ -276,23 +321,25 @@ def system_config_version_new(request, config_id: int):
             messages.error(request, "Content cannot be empty.")
             return redirect(reverse("config_ui:system_config_version_new", args=[cfg.id]))
 
-        if ConfigVersion.objects.filter(config=cfg, version=version).exists():
-            messages.error(request, "That version already exists for this config.")
-            return redirect(reverse("config_ui:system_config_version_new", args=[cfg.id]))
-
-        if int(cfg.level) == 4:
+        if cfg.level == 4:
             missing = _validate_l4_minimal(content_text)
             if missing:
                 messages.error(request, "L4 content is missing required markers: " + ", ".join(missing))
                 return redirect(reverse("config_ui:system_config_version_new", args=[cfg.id]))
 
-        ConfigVersion.objects.create(
-            config=cfg,
-            version=version,
-            content_text=content_text,
-            change_note=change_note,
-            created_by=request.user,
-        )
+        # unique_together (config, version) rejects duplicates in the INSERT.
+        try:
+            with transaction.atomic():
+                ConfigVersion.objects.create(
+                    config=cfg,
+                    version=version,
+                    content_text=content_text,
+                    change_note=change_note,
+                    created_by=request.user,
+                )
+        except IntegrityError:
+            messages.error(request, "That version already exists for this config.")
+            return redirect(reverse("config_ui:system_config_version_new", args=[cfg.id]))
 
         messages.success(request, "New version created.")
         return redirect(reverse("config_ui:system_config_detail", args=[cfg.id]))
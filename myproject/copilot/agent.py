@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import concurrent.futures
+import threading
 from dataclasses import dataclass
 from typing import Any
 
@@ -10,30 +13,35 @@ class _CopilotResult:
     text: str
 
 
+def _list_item_text(item: Any) -> str:
+    if isinstance(item, str):
+        return item.strip()
+    if isinstance(item, dict):
+        return str(item.get("text") or item.get("content") or "").strip()
+    return str(item).strip()
+
+
 def _as_text(value: Any) -> str:
     if value is None:
         return ""
     if isinstance(value, str):
         return value
     if isinstance(value, list):
-        chunks = []
-        for item in value:
-            if isinstance(item, str):
-                if item.strip():
-                    chunks.append(item.strip())
-                continue
-            if isinstance(item, dict):
-                txt = str(item.get("text") or item.get("content") or "").strip()
-                if txt:
-                    chunks.append(txt)
-                continue
-            txt = str(item).strip()
-            if txt:
-                chunks.append(txt)
-        return "\n".join(chunks).strip()
+        return "\n".join([t for t in map(_list_item_text, value) if t]).strip()
     return str(value).strip()
 
 
+# Event classes seen so far -> whether they define to_dict().
+_HAS_TO_DICT: dict[type, bool] = {}
+
+
+def _has_to_dict(cls: type) -> bool:
+    has = _HAS_TO_DICT.get(cls)
+    if has is None:
+        has = _HAS_TO_DICT[cls] = hasattr(cls, "to_dict")
+    return has
+
+
 def _extract_event_text(event: Any) -> str:
     if event is None:
         return ""
@@ -42,16 +50,21 @@ def _extract_event_text(event: Any) -> str:
         return _as_text(event)
 
     content = getattr(data, "content", None)
-    text = _as_text(content)
-    if text:
-        return text
+    if isinstance(content, str):
+        # Common case: plain string content, no normalisation needed.
+        if content:
+            return content
+    else:
+        text = _as_text(content)
+        if text:
+            return text
 
     for field_name in ("text", "message", "output"):
         text = _as_text(getattr(data, field_name, None))
         if text:
             return text
 
-    if hasattr(data, "to_dict"):
+    if _has_to_dict(type(data)):
         try:
             payload = data.to_dict()
         except Exception:
@@ -64,17 +77,88 @@ def _extract_event_text(event: Any) -> str:
     return _as_text(data)
 
 
+# One long-lived event loop in a daemon thread runs every Copilot call, so
+# neither the loop nor the CopilotClient is rebuilt per prompt. The loop is
+# started on first use rather than at import time.
+_BG_LOOP: asyncio.AbstractEventLoop | None = None
+_BG_LOOP_LOCK = threading.Lock()
+_RUN_TIMEOUT = 150.0  # send_and_wait allows 120s; leave room for session setup
+
+_CLIENT: Any = None
+_CLIENT_LOCK: asyncio.Lock | None = None  # only touched on _BG_LOOP
+
+
+def _get_bg_loop() -> asyncio.AbstractEventLoop:
+    global _BG_LOOP
+    if _BG_LOOP is None:
+        with _BG_LOOP_LOCK:
+            if _BG_LOOP is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="copilot-loop", daemon=True).start()
+                _BG_LOOP = loop
+    return _BG_LOOP
+
+
 def _run_coro(coro):
+    # Works the same from plain sync code and from inside a running loop.
+    future = asyncio.run_coroutine_threadsafe(coro, _get_bg_loop())
     try:
-        return asyncio.run(coro)
-    except RuntimeError as exc:
-        if "asyncio.run() cannot be called from a running event loop" not in str(exc):
-            raise
-        loop = asyncio.new_event_loop()
-        try:
-            return loop.run_until_complete(coro)
-        finally:
-            loop.close()
+        return future.result(timeout=_RUN_TIMEOUT)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise
+
+
+async def _get_client():
+    global _CLIENT, _CLIENT_LOCK
+    if _CLIENT_LOCK is None:
+        _CLIENT_LOCK = asyncio.Lock()
+    async with _CLIENT_LOCK:
+        if _CLIENT is None:
+            from copilot import CopilotClient
+
+            client = CopilotClient()
+            await client.start()
+            _CLIENT = client
+    return _CLIENT
+
+
+async def _reset_client(client: Any) -> None:
+    global _CLIENT
+    if _CLIENT is client:
+        _CLIENT = None
+    try:
+        await client.stop()
+    except Exception:
+        pass
+
+
+async def _safe_destroy(session: Any) -> None:
+    try:
+        await session.destroy()
+    except Exception:
+        pass
+
+
+# Strong refs so pending cleanup tasks are not garbage-collected mid-flight.
+_CLEANUP_TASKS: set[asyncio.Task] = set()
+
+
+def _destroy_in_background(session: Any) -> None:
+    task = asyncio.get_running_loop().create_task(_safe_destroy(session))
+    _CLEANUP_TASKS.add(task)
+    task.add_done_callback(_CLEANUP_TASKS.discard)
+
+
+@atexit.register
+def _stop_client_at_exit() -> None:
+    # The shared client lives for the process; stop it once on shutdown.
+    if _BG_LOOP is None or _CLIENT is None:
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_reset_client(_CLIENT), _BG_LOOP).result(timeout=5.0)
+    except Exception:
+        pass
 
 
 class _CopilotAdapter:
@@ -83,26 +167,20 @@ class _CopilotAdapter:
         return _CopilotResult(text=text)
 
     async def _run_async(self, prompt: str) -> str:
-        from copilot import CopilotClient
-
-        client = CopilotClient()
-        await client.start()
+        client = await _get_client()
         try:
             session = await client.create_session()
-            try:
-                event = await session.send_and_wait({"prompt": prompt}, timeout=120.0)
-                return _extract_event_text(event)
-            finally:
-                try:
-                    await session.destroy()
-                except Exception:
-                    pass
+        except Exception:
+            # Assume the shared client is broken; the next call starts afresh.
+            await _reset_client(client)
+            raise
+        try:
+            event = await session.send_and_wait({"prompt": prompt}, timeout=120.0)
+            return _extract_event_text(event)
         finally:
-            try:
-                await client.stop()
-            except Exception:
-                pass
+            # The caller only needs the text; tear the session down off the
+            # response path on the (long-lived) background loop.
+            _destroy_in_background(session)
 
 
 copilot = _CopilotAdapter()
-
@@ -1,5 +1,6 @@
 # navigator/admin.py
 from django.contrib import admin
+from django.db.models import Q
 from .models import NavigatorRun, InvocationLog, RoutingEvent, TransferApproval
 
 
@@ -7,6 +8,7 @@ from .models import NavigatorRun, InvocationLog, RoutingEvent, TransferApproval
 @admin.register(NavigatorRun)
 class NavigatorRunAdmin(admin.ModelAdmin):
     list_display = ("id", "project", "chat", "work_type", "mode", "workflow_ref", "started_at", "ended_at")
+    list_select_related = ("project", "chat")
     list_filter = ("work_type", "mode")
     search_fields = ("workflow_ref", "chat__title", "project__name")
     autocomplete_fields = ("project", "chat")
@@ -17,27 +19,52 @@ class NavigatorRunAdmin(admin.ModelAdmin):
 @admin.register(InvocationLog)
 class InvocationLogAdmin(admin.ModelAdmin):
     list_display = ("run", "compartment", "backend", "created_at")
+    list_select_related = ("run",)
     list_filter = ("compartment", "backend")
-    search_fields = ("backend", "input_hash", "output_hash")
+    search_fields = ("backend",)
     autocomplete_fields = ("run",)
     ordering = ("-created_at",)
+    list_per_page = 50
+    show_full_result_count = False
+    readonly_fields = ("input_hash_hex", "output_hash_hex")
+
+    def get_search_results(self, request, queryset, search_term):
+        # Keep the filtered changelist queryset so hash matches respect it.
+        base_qs = queryset
+        queryset, may_have_duplicates = super().get_search_results(request, queryset, search_term)
+        # Hashes are stored as raw digests: a full hex digest matches exactly.
+        term = search_term.strip()
+        if len(term) == 64:
+            try:
+                digest = bytes.fromhex(term)
+            except ValueError:
+                pass
+            else:
+                queryset |= base_qs.filter(Q(input_hash=digest) | Q(output_hash=digest))
+        return queryset, may_have_duplicates
 
 
 # RoutingEvent shows how channels were mapped to compartments.
 @admin.register(RoutingEvent)
 class RoutingEventAdmin(admin.ModelAdmin):
     list_display = ("run", "channel", "routed_compartment", "policy_ref", "created_at")
+    list_select_related = ("run",)
     list_filter = ("channel", "routed_compartment")
     search_fields = ("policy_ref", "note")
     autocomplete_fields = ("run",)
     ordering = ("-created_at",)
+    list_per_page = 50
+    show_full_result_count = False
 
 
 # TransferApproval records explicit cross-compartment approvals.
 @admin.register(TransferApproval)
 class TransferApprovalAdmin(admin.ModelAdmin):
     list_display = ("run", "transfer_type", "from_compartment", "to_compartment", "classification", "approver", "created_at")
+    list_select_related = ("run", "approver")
     list_filter = ("transfer_type", "classification")
     search_fields = ("rationale", "content_ref")
     autocomplete_fields = ("run", "approver", "obj")
     ordering = ("-created_at",)
+    list_per_page = 50
+    show_full_result_count = False
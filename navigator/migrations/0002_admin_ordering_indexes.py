@@ -0,0 +1,29 @@
+# Generated by Django 6.0.1 on 2026-10-17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('navigator', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='navigatorrun',
+            index=models.Index(fields=['-started_at', '-id'], name='nav_run_started_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='invocationlog',
+            index=models.Index(fields=['-created_at', '-id'], name='nav_invlog_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='routingevent',
+            index=models.Index(fields=['-created_at', '-id'], name='nav_routing_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transferapproval',
+            index=models.Index(fields=['-created_at', '-id'], name='nav_transfer_created_idx'),
+        ),
+    ]
@@ -0,0 +1,101 @@
+# Generated by Django 6.0.1 on 2026-10-17
+
+from django.db import migrations, models
+
+
+BATCH_SIZE = 500
+
+HASH_FIELDS = ('input_hash', 'output_hash')
+
+
+def _hex_to_digest(pk, name, value):
+    if not value:
+        return b""
+    try:
+        return bytes.fromhex(value)
+    except ValueError:
+        raise ValueError(
+            f"InvocationLog {pk}: {name}={value!r} is not a hex digest; "
+            f"fix or clear it before migrating."
+        ) from None
+
+
+def _copy_in_batches(InvocationLog, source, target, convert):
+    # The log grows without bound: walk it in pk-ordered chunks and write each
+    # chunk back before reading the next, so memory stays at one chunk.
+    # Keyset paging rather than .iterator(): SQLite gives no isolation between
+    # an open cursor and writes to the same table on one connection.
+    qs = InvocationLog.objects.only('id', *source, *target).order_by('pk')
+    last_pk = 0
+    while True:
+        batch = list(qs.filter(pk__gt=last_pk)[:BATCH_SIZE])
+        if not batch:
+            break
+        for row in batch:
+            for src, dst in zip(source, target):
+                setattr(row, dst, convert(row.pk, src, getattr(row, src)))
+        InvocationLog.objects.bulk_update(batch, list(target), batch_size=BATCH_SIZE)
+        last_pk = batch[-1].pk
+
+
+def hex_to_binary(apps, schema_editor):
+    InvocationLog = apps.get_model('navigator', 'InvocationLog')
+    _copy_in_batches(
+        InvocationLog,
+        HASH_FIELDS,
+        tuple(f'{name}_bin' for name in HASH_FIELDS),
+        _hex_to_digest,
+    )
+
+
+def binary_to_hex(apps, schema_editor):
+    InvocationLog = apps.get_model('navigator', 'InvocationLog')
+    _copy_in_batches(
+        InvocationLog,
+        tuple(f'{name}_bin' for name in HASH_FIELDS),
+        HASH_FIELDS,
+        lambda pk, name, value: bytes(value or b"").hex(),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('navigator', '0002_admin_ordering_indexes'),
+    ]
+
+    # The digests are copied through new columns rather than converted with
+    # AlterField: a database cast between text and binary keeps the hex
+    # characters (or, going back, an escaped form) instead of decoding them,
+    # so neither direction would round-trip.
+    operations = [
+        migrations.AddField(
+            model_name='invocationlog',
+            name='input_hash_bin',
+            field=models.BinaryField(blank=True, default=b'', max_length=32),
+        ),
+        migrations.AddField(
+            model_name='invocationlog',
+            name='output_hash_bin',
+            field=models.BinaryField(blank=True, default=b'', max_length=32),
+        ),
+        migrations.RunPython(hex_to_binary, binary_to_hex),
+        migrations.RemoveField(
+            model_name='invocationlog',
+            name='input_hash',
+        ),
+        migrations.RemoveField(
+            model_name='invocationlog',
+            name='output_hash',
+        ),
+        migrations.RenameField(
+            model_name='invocationlog',
+            old_name='input_hash_bin',
+            new_name='input_hash',
+        ),
+        migrations.RenameField(
+            model_name='invocationlog',
+            old_name='output_hash_bin',
+            new_name='output_hash',
+        ),
+    ]
@@ -29,6 +29,12 @@ class NavigatorRun(models.Model):
     started_at = models.DateTimeField(auto_now_add=True)
     ended_at = models.DateTimeField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            # Matches the admin changelist ORDER BY started_at DESC, id DESC.
+            models.Index(fields=["-started_at", "-id"], name="nav_run_started_idx"),
+        ]
+
     def __str__(self) -> str:
         return f"Run {self.id} ({self.work_type})"
 
@@ -59,8 +65,10 @@ class InvocationLog(models.Model):
     # Optional integrity hooks:
     # Store hashes of the input/output payloads (not the payloads themselves).
     # Useful for tamper-evident logging without sensitive content duplication.
-    input_hash = models.CharField(max_length=64, blank=True)
-    output_hash = models.CharField(max_length=64, blank=True)
+    # Raw SHA-256 digests (hashlib.sha256(...).digest()); use the *_hex
+    # properties for display.
+    input_hash = models.BinaryField(max_length=32, blank=True, default=b"")
+    output_hash = models.BinaryField(max_length=32, blank=True, default=b"")
 
     created_at = models.DateTimeField(auto_now_add=True)
 
@@ -69,8 +77,17 @@ class InvocationLog(models.Model):
             models.Index(fields=["run", "created_at"]),
             models.Index(fields=["compartment"]),
             models.Index(fields=["backend"]),
+            models.Index(fields=["-created_at", "-id"], name="nav_invlog_created_idx"),
         ]
 
+    @property
+    def input_hash_hex(self) -> str:
+        return bytes(self.input_hash or b"").hex()
+
+    @property
+    def output_hash_hex(self) -> str:
+        return bytes(self.output_hash or b"").hex()
+
 
 class RoutingEvent(models.Model):
     """
@@ -105,6 +122,7 @@ class RoutingEvent(models.Model):
             models.Index(fields=["run", "created_at"]),
             models.Index(fields=["channel"]),
             models.Index(fields=["routed_compartment"]),
+            models.Index(fields=["-created_at", "-id"], name="nav_routing_created_idx"),
         ]
 
 
@@ -157,4 +175,5 @@ class TransferApproval(models.Model):
             models.Index(fields=["run", "created_at"]),
             models.Index(fields=["transfer_type"]),
             models.Index(fields=["classification"]),
+            models.Index(fields=["-created_at", "-id"], name="nav_transfer_created_idx"),
         ]
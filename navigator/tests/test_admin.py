@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import hashlib
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from chats.models import ChatWorkspace
+from navigator.models import InvocationLog, NavigatorRun
+from projects.models import Project
+
+UserModel = get_user_model()
+
+
+class InvocationLogAdminSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = UserModel.objects.create_superuser(
+            username="nav_admin", email="nav_admin@example.com", password="pw"
+        )
+        project = Project.objects.create(name="Navigator Project", owner=cls.admin_user)
+        chat = ChatWorkspace.objects.create(project=project, title="Navigator chat", created_by=cls.admin_user)
+        run = NavigatorRun.objects.create(project=project, chat=chat, work_type="Test", mode="Test")
+
+        cls.digest = hashlib.sha256(b"payload").digest()
+        cls.primary = InvocationLog.objects.create(
+            run=run,
+            compartment=InvocationLog.Compartment.PRIMARY,
+            input_hash=cls.digest,
+        )
+        cls.analysis = InvocationLog.objects.create(
+            run=run,
+            compartment=InvocationLog.Compartment.ANALYSIS,
+            output_hash=cls.digest,
+        )
+
+    def setUp(self):
+        self.client.force_login(self.admin_user)
+
+    def _changelist_pks(self, params):
+        resp = self.client.get(reverse("admin:navigator_invocationlog_changelist"), params)
+        self.assertEqual(resp.status_code, 200)
+        return {obj.pk for obj in resp.context["cl"].result_list}
+
+    def test_hash_search_matches_either_digest(self):
+        pks = self._changelist_pks({"q": self.digest.hex()})
+        self.assertEqual(pks, {self.primary.pk, self.analysis.pk})
+
+    def test_hash_search_respects_list_filter(self):
+        pks = self._changelist_pks(
+            {"q": self.digest.hex(), "compartment__exact": InvocationLog.Compartment.PRIMARY}
+        )
+        self.assertEqual(pks, {self.primary.pk})
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # notifications/context_processors.py
 # Purpose:
-# Provide unread count to topbar without adding view logic everywhere.
+# Provide the unread badge to topbar without adding view logic everywhere.
 
 from __future__ import annotations
 
@@ -9,7 +9,7 @@ from typing import Any, Dict
 
 from django.contrib.auth.models import AnonymousUser
 
-from notifications.models import Notification
+from notifications.services import UNREAD_BADGE_MAX, get_unread_count
 
 
 def notifications_bar(request) -> Dict[str, Any]:
@@ -17,10 +17,13 @@ def notifications_bar(request) -> Dict[str, Any]:
     if not user or isinstance(user, AnonymousUser) or not user.is_authenticated:
         return {"rw_notifications": None}
 
-    unread = Notification.objects.filter(recipient=user, is_read=False).count()
+    # Cached briefly per user; this runs on every page load.
+    unread = get_unread_count(user)
 
     return {
         "rw_notifications": {
+            "has_unread": unread > 0,
             "unread_count": unread,
+            "unread_label": f"{UNREAD_BADGE_MAX}+" if unread > UNREAD_BADGE_MAX else str(unread),
         }
     }
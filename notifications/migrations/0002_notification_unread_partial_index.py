@@ -0,0 +1,21 @@
+# Generated by Django 6.0.1 on 2026-10-17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='notification',
+            name='notificatio_recipie_86ea8b_idx',
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(condition=models.Q(('is_read', False)), fields=['recipient', 'created_at'], name='notif_unread_recip_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0.1 on 2026-10-17
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0002_notification_unread_partial_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='notification',
+            name='notificatio_type_ea918f_idx',
+        ),
+    ]
@@ -46,9 +46,16 @@ class Notification(models.Model):
 
     class Meta:
         indexes = [
-            models.Index(fields=["recipient", "is_read", "created_at"]),
+            # Unread rows only: the badge count, unread list and mark-all-read
+            # all filter is_read=False, so read history stays out of the index.
+            models.Index(
+                fields=["recipient", "created_at"],
+                name="notif_unread_recip_idx",
+                condition=models.Q(is_read=False),
+            ),
+            # Full history ("show=all"): newest first per recipient.
+            models.Index(fields=["recipient", "-created_at"], name="notif_recip_ts_idx"),
             models.Index(fields=["project", "created_at"]),
-            models.Index(fields=["type"]),
         ]
 
     def __str__(self) -> str:
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# notifications/services.py
+# Purpose:
+# Short-lived cache of per-user unread counts for the topbar badge.
+# Every code path that creates or (un)reads notifications must clear it.
+
+from __future__ import annotations
+
+from typing import Iterable
+
+from django.core.cache import cache
+
+from notifications.models import Notification
+
+
+UNREAD_COUNT_TIMEOUT = 30
+# The badge shows "99+" beyond this, so counting further is wasted work.
+UNREAD_BADGE_MAX = 99
+
+
+def _unread_count_key(user_id: int) -> str:
+    return f"notif:unread:{user_id}"
+
+
+def get_unread_count(user) -> int:
+    key = _unread_count_key(user.pk)
+    unread = cache.get(key)
+    if unread is None:
+        # Bounded COUNT: stops scanning after UNREAD_BADGE_MAX + 1 rows.
+        unread = Notification.objects.filter(recipient=user, is_read=False)[: UNREAD_BADGE_MAX + 1].count()
+        cache.set(key, unread, UNREAD_COUNT_TIMEOUT)
+    return unread
+
+
+def clear_unread_count(user_ids: Iterable[int]) -> None:
+    keys = [_unread_count_key(uid) for uid in set(user_ids)]
+    if keys:
+        cache.delete_many(keys)
@@ -1,3 +1,21 @@
-from django.test import TestCase
+from __future__ import annotations
 
-# Create your tests here.
+from django.test import SimpleTestCase
+from django.urls import resolve, reverse
+
+from notifications import views
+
+
+class NotificationUrlsResolveTests(SimpleTestCase):
+    def test_urls_resolve(self):
+        cases = [
+            (reverse("notifications:list"), views.notification_list),
+            (reverse("notifications:mark_all_read"), views.notification_mark_all_read),
+            (
+                reverse("notifications:set_read", args=[1, "read"]),
+                views.notification_set_read,
+            ),
+        ]
+        for url, view in cases:
+            with self.subTest(url=url):
+                self.assertIs(resolve(url).func, view)
@@ -3,13 +3,34 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from django.contrib.auth.decorators import login_required
+from django.core.paginator import Paginator
+from django.db import transaction
 from django.http import Http404
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
 from django.utils.http import url_has_allowed_host_and_scheme
 
 from notifications.models import Notification
+from notifications.services import clear_unread_count
+
+
+@lru_cache(maxsize=256)
+def _is_safe_next(url: str, host: str, https: bool) -> bool:
+    if not url_has_allowed_host_and_scheme(
+        url=url,
+        allowed_hosts={host},
+        require_https=https,
+    ):
+        return False
+
+    # Block POST-only endpoints explicitly (prevents redirect loops / 405 JSON)
+    if url.startswith("/accounts/chats/message/"):
+        return False
+
+    return True
 
 
 def _safe_next(request, fallback_url_name: str) -> str:
@@ -18,20 +39,8 @@ def _safe_next(request, fallback_url_name: str) -> str:
     Also block known POST-only endpoints that break if hit via GET.
     """
     nxt = (request.GET.get("next") or "").strip()
-    if not nxt:
+    if not nxt or not _is_safe_next(nxt, request.get_host(), request.is_secure()):
         return reverse(fallback_url_name)
-
-    if not url_has_allowed_host_and_scheme(
-        url=nxt,
-        allowed_hosts={request.get_host()},
-        require_https=request.is_secure(),
-    ):
-        return reverse(fallback_url_name)
-
-    # Block POST-only endpoints explicitly (prevents redirect loops / 405 JSON)
-    if nxt.startswith("/accounts/chats/message/"):
-        return reverse(fallback_url_name)
-
     return nxt
 
 
@@ -44,13 +53,22 @@ def notification_list(request):
         show = "unread"
         qs = qs.filter(is_read=False)
 
-    unread_count = Notification.objects.filter(recipient=request.user, is_read=False).count()
+    # Only the columns the list renders (body is shown inline, so it stays).
+    qs = qs.only("id", "type", "title", "body", "is_read", "created_at", "link_url", "link_object_id")
+    page_obj = Paginator(qs, 50).get_page(request.GET.get("page"))
+
+    if show == "unread":
+        # The paginator already counted exactly these rows.
+        unread_count = page_obj.paginator.count
+    else:
+        unread_count = Notification.objects.filter(recipient=request.user, is_read=False).count()
 
     return render(
         request,
         "notifications/notification_list.html",
         {
-            "notifications": qs[:200],
+            "notifications": page_obj,
+            "page_obj": page_obj,
             "show": show,
             "unread_count": unread_count,
         },
@@ -70,6 +88,7 @@ def notification_set_read(request, notification_id: int, state: str):
     n = get_object_or_404(Notification, pk=notification_id, recipient=request.user)
     n.is_read = (state == "read")
     n.save(update_fields=["is_read"])
+    clear_unread_count([request.user.pk])
 
     return redirect(_safe_next(request, "notifications:list"))
 
@@ -79,5 +98,14 @@ def notification_mark_all_read(request):
     """
     Prototype: GET endpoint to avoid nested-form submission failures.
     """
-    Notification.objects.filter(recipient=request.user, is_read=False).update(is_read=True)
+    with transaction.atomic():
+        pks = list(
+            Notification.objects.select_for_update()
+            .filter(recipient=request.user, is_read=False)
+            .values_list("pk", flat=True)
+        )
+        if pks:
+            Notification.objects.filter(pk__in=pks).update(is_read=True)
+    if pks:
+        clear_unread_count([request.user.pk])
     return redirect(_safe_next(request, "notifications:list"))
@@ -1,6 +1,11 @@
 # objects/admin.py
 from django.contrib import admin
+from django.contrib import messages
+from django.db.models.functions import Substr
 from .models import KnowledgeObject, KnowledgeObjectVersion, KnowledgeLink
+from .services import ObjectWorkflowError, approve_objects, submit_objects_for_approval, with_actor_is_manager
+
+CONTENT_PREVIEW_CHARS = 500
 
 
 class KnowledgeObjectVersionInline(admin.TabularInline):
@@ -11,9 +16,23 @@ class KnowledgeObjectVersionInline(admin.TabularInline):
     model = KnowledgeObjectVersion
     extra = 0
     can_delete = False
-    readonly_fields = ("version", "created_by", "created_at", "change_note", "content_text")
+    fields = ("version", "created_by", "created_at", "change_note", "content_preview")
+    readonly_fields = fields
     ordering = ("-created_at",)
 
+    def get_queryset(self, request):
+        # Full content can be large; the change page only needs a preview.
+        return (
+            super().get_queryset(request)
+            .select_related("created_by")
+            .defer("content_text")
+            .annotate(content_head=Substr("content_text", 1, CONTENT_PREVIEW_CHARS))
+        )
+
+    @admin.display(description="Content")
+    def content_preview(self, obj):
+        return getattr(obj, "content_head", "")
+
 
 class OutgoingLinkInline(admin.TabularInline):
     """
@@ -27,6 +46,9 @@ class OutgoingLinkInline(admin.TabularInline):
     autocomplete_fields = ("to_object",)
     ordering = ("-created_at",)
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("to_object")
+
 
 class IncomingLinkInline(admin.TabularInline):
     """
@@ -40,6 +62,9 @@ class IncomingLinkInline(admin.TabularInline):
     autocomplete_fields = ("from_object",)
     ordering = ("-created_at",)
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("from_object")
+
 
 @admin.register(KnowledgeObject)
 class KnowledgeObjectAdmin(admin.ModelAdmin):
@@ -59,6 +84,7 @@ class KnowledgeObjectAdmin(admin.ModelAdmin):
         "local_id",
         "updated_at",
     )
+    list_select_related = ("project", "owner")
     list_filter = ("object_type", "status", "classification", "project")
     search_fields = (
         "title",
@@ -66,12 +92,15 @@ class KnowledgeObjectAdmin(admin.ModelAdmin):
         "official_id",
         "local_id",
         "domain",
-        "scope_text",
+        # Long free text: prefix match only, not a full substring scan.
+        "^scope_text",
         "owner__username",
         "owner__email",
         "project__name",
     )
     ordering = ("-updated_at",)
+    list_per_page = 50
+    show_full_result_count = False
     readonly_fields = ("created_at", "updated_at")
 
     autocomplete_fields = ("owner", "project")
@@ -85,6 +114,30 @@ class KnowledgeObjectAdmin(admin.ModelAdmin):
     )
 
     inlines = (KnowledgeObjectVersionInline, OutgoingLinkInline, IncomingLinkInline)
+    actions = ["submit_for_approval", "approve_selected"]
+
+    @admin.action(description="Submit selected objects for approval")
+    def submit_for_approval(self, request, queryset):
+        self._run_workflow_batch(request, queryset, submit_objects_for_approval, "Submitted")
+
+    @admin.action(description="Approve selected objects")
+    def approve_selected(self, request, queryset):
+        self._run_workflow_batch(request, queryset, approve_objects, "Approved")
+
+    def _run_workflow_batch(self, request, queryset, service, verb):
+        # The batch services are single-project: run one batch per project.
+        objs = with_actor_is_manager(queryset.select_related("project"), request.user)
+        by_project = {}
+        for obj in objs:
+            by_project.setdefault(obj.project_id, []).append(obj)
+        done = 0
+        for batch in by_project.values():
+            try:
+                done += len(service(objs=batch, actor=request.user))
+            except ObjectWorkflowError as exc:
+                self.message_user(request, str(exc), level=messages.ERROR)
+        if done:
+            self.message_user(request, f"{verb} {done} object(s).", level=messages.SUCCESS)
 
 
 @admin.register(KnowledgeObjectVersion)
@@ -93,9 +146,13 @@ class KnowledgeObjectVersionAdmin(admin.ModelAdmin):
     Admin view for immutable versions.
     """
     list_display = ("id", "obj", "version", "created_by", "created_at", "change_note")
-    list_filter = ("created_at", "created_by")
-    search_fields = ("obj__title", "version", "change_note", "content_text", "created_by__username")
+    list_select_related = ("obj", "created_by")
+    date_hierarchy = "created_at"
+    # Long free text: prefix match only, not a full substring scan.
+    search_fields = ("obj__title", "version", "change_note", "^content_text", "created_by__username")
     ordering = ("-created_at",)
+    list_per_page = 50
+    show_full_result_count = False
     readonly_fields = ("created_at",)
 
     autocomplete_fields = ("obj", "created_by")
@@ -107,8 +164,12 @@ class KnowledgeLinkAdmin(admin.ModelAdmin):
     Admin view for explicit links between knowledge objects.
     """
     list_display = ("id", "link_type", "from_object", "to_object", "created_at")
-    list_filter = ("link_type", "created_at")
+    list_select_related = ("from_object", "to_object")
+    list_filter = ("link_type",)
+    date_hierarchy = "created_at"
     search_fields = ("from_object__title", "to_object__title", "note")
     ordering = ("-created_at",)
+    list_per_page = 50
+    show_full_result_count = False
 
     autocomplete_fields = ("from_object", "to_object")
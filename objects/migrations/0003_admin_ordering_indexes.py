@@ -0,0 +1,25 @@
+# Generated by Django 6.0.1 on 2026-10-17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('objects', '0002_knowledgeobject_approved_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='knowledgeobject',
+            index=models.Index(fields=['-updated_at', '-id'], name='ko_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='knowledgeobjectversion',
+            index=models.Index(fields=['-created_at', '-id'], name='ko_version_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='knowledgelink',
+            index=models.Index(fields=['-created_at', '-id'], name='ko_link_created_idx'),
+        ),
+    ]
@@ -109,6 +109,11 @@ class KnowledgeObject(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["-updated_at", "-id"], name="ko_updated_idx"),
+        ]
+
     def __str__(self) -> str:
         return f"{self.object_type}:{self.title}"
 
@@ -125,6 +130,11 @@ class KnowledgeObjectVersion(models.Model):
     created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.PROTECT)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], name="ko_version_created_idx"),
+        ]
+
     def __str__(self) -> str:
         return f"{self.obj_id}@{self.version}"
 
@@ -148,5 +158,10 @@ class KnowledgeLink(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], name="ko_link_created_idx"),
+        ]
+
     def __str__(self) -> str:
         return f"{self.from_object_id} -{self.link_type}-> {self.to_object_id}"
@@ -5,63 +5,80 @@
 
 from __future__ import annotations
 
-from typing import Iterable, List, Optional
+from functools import partial
+from typing import Iterable, List, Optional, Set
 
-from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractUser
 from django.db import transaction
 from django.utils import timezone
-from django.db.models import Q
+from django.db.models import Case, CharField, Exists, F, OuterRef, Q, QuerySet, Value, When
+from django.db.models.functions import Cast, Concat, LPad
 
 from accounts.models import Role, UserRole
 from notifications.models import Notification
+from notifications.services import clear_unread_count
 from objects.models import KnowledgeObject
 from projects.models import Project
 
 
-UserModel = get_user_model()
-
-
 class ObjectWorkflowError(Exception):
     pass
 
 
-def _project_managers(project: Project) -> List[AbstractUser]:
+def _project_manager_ids(project: Project) -> Set[int]:
     """
     Managers for a project are:
     - explicit MANAGER roles (PROJECT scope)
     - plus the project owner (added by caller if needed)
     """
-    manager_ids = list(
+    return set(
         UserRole.objects.filter(
             project=project,
             scope_type=UserRole.ScopeType.PROJECT,
             role__name=Role.Name.MANAGER,
         ).values_list("user_id", flat=True)
     )
-    if not manager_ids:
-        return []
-    return list(UserModel.objects.filter(id__in=manager_ids))
 
 
-def _is_manager(project: Project, user: AbstractUser) -> bool:
+def _manager_role_filter(user: AbstractUser) -> Q:
+    return Q(
+        user=user,
+        scope_type=UserRole.ScopeType.PROJECT,
+        role__name=Role.Name.MANAGER,
+    )
+
+
+def with_actor_is_manager(queryset: QuerySet, actor: AbstractUser) -> QuerySet:
+    """
+    Annotate KnowledgeObjects with actor_is_manager so approve/reject can
+    check the actor's MANAGER role without a separate query.
+    """
+    if not getattr(actor, "is_authenticated", False):
+        return queryset.annotate(actor_is_manager=Value(False))
+    return queryset.annotate(
+        actor_is_manager=Exists(
+            UserRole.objects.filter(_manager_role_filter(actor), project=OuterRef("project"))
+        )
+    )
+
+
+def _is_manager(project: Project, user: AbstractUser, obj: Optional[KnowledgeObject] = None) -> bool:
     if not getattr(user, "is_authenticated", False):
         return False
     if user.is_superuser or user.is_staff:
         return True
     if project.owner_id == user.id:
         return True
-    return UserRole.objects.filter(
-        project=project,
-        user=user,
-        scope_type=UserRole.ScopeType.PROJECT,
-        role__name=Role.Name.MANAGER,
-    ).exists()
+    # Set by with_actor_is_manager() for this same actor.
+    annotated = getattr(obj, "actor_is_manager", None)
+    if annotated is not None:
+        return bool(annotated)
+    return UserRole.objects.filter(_manager_role_filter(user), project=project).exists()
 
 
 def _notify(
     *,
-    recipients: Iterable[AbstractUser],
+    recipient_ids: Iterable[int],
     project: Optional[Project],
     type_: str,
     title: str,
@@ -69,21 +86,29 @@ def _notify(
     obj: Optional[KnowledgeObject] = None,
     link_url: str = "",
 ) -> None:
-    rows = []
-    for r in recipients:
-        rows.append(
-            Notification(
-                recipient=r,
-                project=project,
-                type=type_,
-                title=title,
-                body=body,
-                link_object=obj,
-                link_url=link_url,
-            )
+    recipient_ids = list(recipient_ids)
+    if not recipient_ids:
+        return
+    project_id = project.pk if project else None
+    link_object_id = obj.pk if obj else None
+    rows = [
+        Notification(
+            recipient_id=rid,
+            project_id=project_id,
+            type=type_,
+            title=title,
+            body=body,
+            link_object_id=link_object_id,
+            link_url=link_url,
         )
-    if rows:
-        Notification.objects.bulk_create(rows)
+        for rid in recipient_ids
+    ]
+    _save_notifications(rows, recipient_ids)
+
+
+def _save_notifications(rows: List[Notification], recipient_ids: Iterable[int]) -> None:
+    Notification.objects.bulk_create(rows, batch_size=1000)
+    clear_unread_count(recipient_ids)
 
 
 def _issue_official_id(obj: KnowledgeObject) -> str:
@@ -96,6 +121,36 @@ def _issue_official_id(obj: KnowledgeObject) -> str:
     return f"{obj.object_type}-{obj.pk:06d}"
 
 
+# DB-side equivalent of _issue_official_id for queryset.update().
+_OFFICIAL_ID_SQL = Case(
+    When(~Q(official_id=""), then=F("official_id")),
+    When(
+        id__lt=1000000,
+        then=Concat("object_type", Value("-"), LPad(Cast("id", CharField()), 6, Value("0"))),
+    ),
+    default=Concat("object_type", Value("-"), Cast("id", CharField())),
+    output_field=CharField(),
+)
+
+
+def _batch_project(objs: List[KnowledgeObject], action: str) -> Project:
+    """
+    The shared project of a batch. Batches are single-project so manager
+    resolution and the permission check run once.
+    """
+    if any(o.project_id is None for o in objs):
+        raise ObjectWorkflowError(f"Object must be project-scoped to {action} (project is NULL).")
+    if len({o.project_id for o in objs}) > 1:
+        raise ObjectWorkflowError(f"Objects must belong to the same project to {action} together.")
+    return objs[0].project
+
+
+def _require_contested(objs: List[KnowledgeObject], action: str) -> None:
+    for obj in objs:
+        if obj.status != KnowledgeObject.Status.CONTESTED:
+            raise ObjectWorkflowError(f"Object must be CONTESTED to {action} (is {obj.status}).")
+
+
 # ------------------------------------------------------------
 # Selects what projects and chats are available to the user
 # ------------------------------------------------------------
@@ -142,28 +197,108 @@ def submit_object_for_approval(*, obj: KnowledgeObject, actor: AbstractUser) ->
     obj.status = KnowledgeObject.Status.CONTESTED
     obj.save(update_fields=["submitted_by", "submitted_at", "status", "updated_at"])
 
-    managers = _project_managers(project)
-    if project.owner and project.owner not in managers:
-        managers.append(project.owner)
-
-    _notify(
-        recipients=managers,
-        project=project,
-        type_=Notification.Type.NEEDS_APPROVAL,
-        title="Needs approval",
-        body=f"{obj.object_type} '{obj.title}' submitted for approval.",
-        obj=obj,
+    manager_ids = _project_manager_ids(project)
+    if project.owner_id:
+        manager_ids.add(project.owner_id)
+
+    transaction.on_commit(
+        partial(
+            _notify,
+            recipient_ids=manager_ids,
+            project=project,
+            type_=Notification.Type.NEEDS_APPROVAL,
+            title="Needs approval",
+            body=f"{obj.object_type} '{obj.title}' submitted for approval.",
+            obj=obj,
+        )
     )
     return obj
 
 
+@transaction.atomic
+def submit_objects_for_approval(*, objs: Iterable[KnowledgeObject], actor: AbstractUser) -> List[KnowledgeObject]:
+    """
+    Batched form of submit_object_for_approval for objects in one project:
+    one UPDATE for all objects and one bulk insert for all notifications.
+    """
+    objs = list(objs)
+    if not objs:
+        return objs
+    project = _batch_project(objs, "submit for approval")
+    pks = [o.pk for o in objs]
+    now = timezone.now()
+
+    # Sandbox: auto-approve
+    if project.kind == Project.Kind.SANDBOX:
+        KnowledgeObject.objects.filter(pk__in=pks).update(
+            submitted_by=actor,
+            submitted_at=now,
+            approved_by=actor,
+            approved_at=now,
+            rejected_by=None,
+            rejected_at=None,
+            rejection_reason="",
+            status=KnowledgeObject.Status.ACCEPTED,
+            official_id=_OFFICIAL_ID_SQL,
+            updated_at=now,
+        )
+        for obj in objs:
+            obj.submitted_by = actor
+            obj.submitted_at = now
+            obj.approved_by = actor
+            obj.approved_at = now
+            obj.rejected_by = None
+            obj.rejected_at = None
+            obj.rejection_reason = ""
+            obj.status = KnowledgeObject.Status.ACCEPTED
+            obj.official_id = _issue_official_id(obj)
+            obj.updated_at = now
+        return objs
+
+    # Standard: submit -> CONTESTED + notify managers (+ owner)
+    KnowledgeObject.objects.filter(pk__in=pks).update(
+        submitted_by=actor,
+        submitted_at=now,
+        status=KnowledgeObject.Status.CONTESTED,
+        updated_at=now,
+    )
+    for obj in objs:
+        obj.submitted_by = actor
+        obj.submitted_at = now
+        obj.status = KnowledgeObject.Status.CONTESTED
+        obj.updated_at = now
+
+    manager_ids = _project_manager_ids(project)
+    if project.owner_id:
+        manager_ids.add(project.owner_id)
+    if not manager_ids:
+        return objs
+
+    # One body per object, shared by all of its recipients.
+    bodies = [(obj.pk, f"{obj.object_type} '{obj.title}' submitted for approval.") for obj in objs]
+    rows = [
+        Notification(
+            recipient_id=rid,
+            project_id=project.pk,
+            type=Notification.Type.NEEDS_APPROVAL,
+            title="Needs approval",
+            body=body,
+            link_object_id=obj_id,
+        )
+        for obj_id, body in bodies
+        for rid in manager_ids
+    ]
+    transaction.on_commit(partial(_save_notifications, rows, manager_ids))
+    return objs
+
+
 @transaction.atomic
 def approve_object(*, obj: KnowledgeObject, actor: AbstractUser) -> KnowledgeObject:
     if obj.project_id is None:
         raise ObjectWorkflowError("Object must be project-scoped to approve (project is NULL).")
 
     project = obj.project
-    if not _is_manager(project, actor):
+    if not _is_manager(project, actor, obj):
         raise ObjectWorkflowError("Only a project manager may approve.")
 
     if obj.status != KnowledgeObject.Status.CONTESTED:
@@ -190,13 +325,16 @@ def approve_object(*, obj: KnowledgeObject, actor: AbstractUser) -> KnowledgeObj
         ]
     )
 
-    _notify(
-        recipients=[obj.owner],
-        project=project,
-        type_=Notification.Type.APPROVED,
-        title="Approved",
-        body=f"{obj.object_type} '{obj.title}' was approved.",
-        obj=obj,
+    transaction.on_commit(
+        partial(
+            _notify,
+            recipient_ids=[obj.owner_id],
+            project=project,
+            type_=Notification.Type.APPROVED,
+            title="Approved",
+            body=f"{obj.object_type} '{obj.title}' was approved.",
+            obj=obj,
+        )
     )
     return obj
 
@@ -207,7 +345,7 @@ def reject_object(*, obj: KnowledgeObject, actor: AbstractUser, reason: str, clo
         raise ObjectWorkflowError("Object must be project-scoped to reject (project is NULL).")
 
     project = obj.project
-    if not _is_manager(project, actor):
+    if not _is_manager(project, actor, obj):
         raise ObjectWorkflowError("Only a project manager may reject.")
 
     if obj.status != KnowledgeObject.Status.CONTESTED:
@@ -220,12 +358,112 @@ def reject_object(*, obj: KnowledgeObject, actor: AbstractUser, reason: str, clo
     obj.rejection_reason = reason.strip()
     obj.save(update_fields=["status", "rejected_by", "rejected_at", "rejection_reason", "updated_at"])
 
-    _notify(
-        recipients=[obj.owner],
-        project=project,
-        type_=Notification.Type.REJECTED,
-        title="Rejected",
-        body=f"{obj.object_type} '{obj.title}' was rejected. {obj.rejection_reason}",
-        obj=obj,
+    transaction.on_commit(
+        partial(
+            _notify,
+            recipient_ids=[obj.owner_id],
+            project=project,
+            type_=Notification.Type.REJECTED,
+            title="Rejected",
+            body=f"{obj.object_type} '{obj.title}' was rejected. {obj.rejection_reason}",
+            obj=obj,
+        )
     )
     return obj
+
+
+@transaction.atomic
+def approve_objects(*, objs: Iterable[KnowledgeObject], actor: AbstractUser) -> List[KnowledgeObject]:
+    """
+    Batched form of approve_object for objects in one project: one UPDATE and
+    one bulk insert of owner notifications.
+    """
+    objs = list(objs)
+    if not objs:
+        return objs
+    project = _batch_project(objs, "approve")
+    if not _is_manager(project, actor, objs[0]):
+        raise ObjectWorkflowError("Only a project manager may approve.")
+    _require_contested(objs, "approve")
+
+    now = timezone.now()
+    KnowledgeObject.objects.filter(pk__in=[o.pk for o in objs]).update(
+        status=KnowledgeObject.Status.ACCEPTED,
+        approved_by=actor,
+        approved_at=now,
+        rejected_by=None,
+        rejected_at=None,
+        rejection_reason="",
+        official_id=_OFFICIAL_ID_SQL,
+        updated_at=now,
+    )
+    for obj in objs:
+        obj.status = KnowledgeObject.Status.ACCEPTED
+        obj.approved_by = actor
+        obj.approved_at = now
+        obj.rejected_by = None
+        obj.rejected_at = None
+        obj.rejection_reason = ""
+        obj.official_id = _issue_official_id(obj)
+        obj.updated_at = now
+
+    rows = [
+        Notification(
+            recipient_id=obj.owner_id,
+            project_id=project.pk,
+            type=Notification.Type.APPROVED,
+            title="Approved",
+            body=f"{obj.object_type} '{obj.title}' was approved.",
+            link_object_id=obj.pk,
+        )
+        for obj in objs
+    ]
+    transaction.on_commit(partial(_save_notifications, rows, {o.owner_id for o in objs}))
+    return objs
+
+
+@transaction.atomic
+def reject_objects(
+    *, objs: Iterable[KnowledgeObject], actor: AbstractUser, reason: str, close: bool = False
+) -> List[KnowledgeObject]:
+    """
+    Batched form of reject_object for objects in one project, sharing one reason.
+    """
+    objs = list(objs)
+    if not objs:
+        return objs
+    project = _batch_project(objs, "reject")
+    if not _is_manager(project, actor, objs[0]):
+        raise ObjectWorkflowError("Only a project manager may reject.")
+    _require_contested(objs, "reject")
+
+    now = timezone.now()
+    status = KnowledgeObject.Status.REJECTED_CLOSED if close else KnowledgeObject.Status.REJECTED_REWORK
+    reason = reason.strip()
+    KnowledgeObject.objects.filter(pk__in=[o.pk for o in objs]).update(
+        status=status,
+        rejected_by=actor,
+        rejected_at=now,
+        rejection_reason=reason,
+        updated_at=now,
+    )
+    for obj in objs:
+        obj.status = status
+        obj.rejected_by = actor
+        obj.rejected_at = now
+        obj.rejection_reason = reason
+        obj.updated_at = now
+
+    rows = [
+        Notification(
+            recipient_id=obj.owner_id,
+            project_id=project.pk,
+            type=Notification.Type.REJECTED,
+            title="Rejected",
+            body=f"{obj.object_type} '{obj.title}' was rejected. {reason}",
+            link_object_id=obj.pk,
+        )
+        for obj in objs
+    ]
+    transaction.on_commit(partial(_save_notifications, rows, {o.owner_id for o in objs}))
+    return objs
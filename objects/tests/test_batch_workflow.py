@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from accounts.models import Role, UserRole
+from notifications.models import Notification
+from objects.models import KnowledgeObject
+from objects.services import (
+    ObjectWorkflowError,
+    approve_objects,
+    reject_objects,
+    submit_objects_for_approval,
+    with_actor_is_manager,
+)
+from projects.models import Project
+
+UserModel = get_user_model()
+
+
+def _data_queries(ctx) -> list[str]:
+    # atomic() inside TestCase adds SAVEPOINT/RELEASE; count only real work.
+    return [q["sql"] for q in ctx.captured_queries if "SAVEPOINT" not in q["sql"].upper()]
+
+
+class BatchWorkflowTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = UserModel.objects.create_user(username="kobj_owner", email="kobj_owner@example.com", password="pw")
+        cls.manager = UserModel.objects.create_user(username="kobj_mgr", email="kobj_mgr@example.com", password="pw")
+        cls.author = UserModel.objects.create_user(username="kobj_author", email="kobj_author@example.com", password="pw")
+        cls.project = Project.objects.create(name="Batch Workflow Project", owner=cls.owner)
+        manager_role, _ = Role.objects.get_or_create(name=Role.Name.MANAGER)
+        UserRole.objects.create(
+            user=cls.manager,
+            role=manager_role,
+            scope_type=UserRole.ScopeType.PROJECT,
+            project=cls.project,
+        )
+
+    def _mk_objects(self, n: int, status=KnowledgeObject.Status.CANDIDATE):
+        for i in range(n):
+            KnowledgeObject.objects.create(
+                object_type=KnowledgeObject.ObjectType.CKO,
+                title=f"Object {i}",
+                owner=self.author,
+                project=self.project,
+                status=status,
+            )
+        return list(KnowledgeObject.objects.filter(project=self.project).select_related("project").order_by("pk"))
+
+    def test_submit_batch_runs_constant_queries(self):
+        objs = self._mk_objects(3)
+        with CaptureQueriesContext(connection) as ctx:
+            with self.captureOnCommitCallbacks(execute=True):
+                submit_objects_for_approval(objs=objs, actor=self.author)
+        # UPDATE objects, SELECT manager ids, INSERT notifications.
+        self.assertEqual(len(_data_queries(ctx)), 3)
+
+        self.assertEqual(
+            set(KnowledgeObject.objects.values_list("status", flat=True)),
+            {KnowledgeObject.Status.CONTESTED},
+        )
+        # One notification per (recipient, object): manager + project owner.
+        self.assertEqual(
+            Notification.objects.filter(type=Notification.Type.NEEDS_APPROVAL).count(),
+            2 * len(objs),
+        )
+        self.assertEqual(
+            set(Notification.objects.values_list("recipient_id", flat=True)),
+            {self.manager.pk, self.owner.pk},
+        )
+
+    def test_approve_batch_issues_official_ids_and_notifies_owner(self):
+        self._mk_objects(2, status=KnowledgeObject.Status.CONTESTED)
+        objs = list(
+            with_actor_is_manager(KnowledgeObject.objects.select_related("project"), self.manager).order_by("pk")
+        )
+        with CaptureQueriesContext(connection) as ctx:
+            with self.captureOnCommitCallbacks(execute=True):
+                approve_objects(objs=objs, actor=self.manager)
+        # Manager flag came with the SELECT: UPDATE objects, INSERT notifications.
+        self.assertEqual(len(_data_queries(ctx)), 2)
+
+        for obj in KnowledgeObject.objects.order_by("pk"):
+            self.assertEqual(obj.status, KnowledgeObject.Status.ACCEPTED)
+            self.assertEqual(obj.official_id, f"CKO-{obj.pk:06d}")
+        self.assertEqual(
+            Notification.objects.filter(type=Notification.Type.APPROVED, recipient=self.author).count(),
+            2,
+        )
+
+    def test_reject_batch_requires_manager(self):
+        objs = self._mk_objects(2, status=KnowledgeObject.Status.CONTESTED)
+        with self.assertRaises(ObjectWorkflowError):
+            reject_objects(objs=objs, actor=self.author, reason="no")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            reject_objects(objs=objs, actor=self.manager, reason=" needs work ")
+        self.assertEqual(
+            set(KnowledgeObject.objects.values_list("status", "rejection_reason")),
+            {(KnowledgeObject.Status.REJECTED_REWORK, "needs work")},
+        )
+        self.assertEqual(Notification.objects.filter(type=Notification.Type.REJECTED).count(), 2)
+
+    def test_batch_rejects_non_contested_objects(self):
+        objs = self._mk_objects(1)
+        with self.assertRaises(ObjectWorkflowError):
+            approve_objects(objs=objs, actor=self.manager)
@@ -6,7 +6,7 @@ from __future__ import annotations
 from django import forms
 from django.contrib import admin
 from django.contrib import messages
-from django.db import transaction
+from django.db.models import BooleanField, Case, Value, When
 from django.utils.html import format_html
 
 from config.models import ConfigRecord, ConfigScope
@@ -42,9 +42,10 @@ class PhaseContractAdmin(admin.ModelAdmin):
         contract = queryset.first()
         if not contract:
             return
-        with transaction.atomic():
-            PhaseContract.objects.filter(key=contract.key).update(is_active=False)
-            PhaseContract.objects.filter(pk=contract.pk).update(is_active=True)
+        # One UPDATE flips the whole key: only the chosen version stays active.
+        PhaseContract.objects.filter(key=contract.key).update(
+            is_active=Case(When(pk=contract.pk, then=Value(True)), default=Value(False), output_field=BooleanField())
+        )
         self.message_user(request, f"Activated {contract.key} v{contract.version}.", level=messages.SUCCESS)
 
 
@@ -52,6 +53,14 @@ class PhaseContractAdmin(admin.ModelAdmin):
 # Project form: constrain active_l4_config to L4 PROJECT-scoped
 # ------------------------------------------------------------
 
+# Never evaluated directly; each form narrows a clone of it.
+_L4_PROJECT_CONFIGS = ConfigRecord.objects.filter(
+    level=ConfigRecord.Level.L4,
+    status=ConfigRecord.Status.ACTIVE,
+    scope__scope_type=ConfigScope.ScopeType.PROJECT,
+).select_related("scope")
+
+
 class ProjectAdminForm(forms.ModelForm):
     class Meta:
         model = Project
@@ -64,22 +73,11 @@ class ProjectAdminForm(forms.ModelForm):
         if not field:
             return
 
-        qs = (
-            ConfigRecord.objects.filter(
-                level=ConfigRecord.Level.L4,
-                status=ConfigRecord.Status.ACTIVE,
-                scope__scope_type=ConfigScope.ScopeType.PROJECT,
-            )
-            .select_related("scope")
-        )
-
         # When creating a Project, we don't know the project yet, so show none.
         if self.instance and self.instance.pk:
-            qs = qs.filter(scope__project=self.instance)
+            field.queryset = _L4_PROJECT_CONFIGS.filter(scope__project=self.instance)
         else:
-            qs = qs.none()
-
-        field.queryset = qs
+            field.queryset = _L4_PROJECT_CONFIGS.none()
         field.required = False
 
 
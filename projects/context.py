@@ -26,18 +26,28 @@ def resolve_effective_context(
 
     Precedence (highest wins, unless forbidden):
       SESSION > UserProjectPrefs > ProjectPolicy > inherited defaults
+
+    Pass a project loaded with select_related("policy") to avoid a separate
+    policy query.
     """
 
     policy = project.policy
     prefs = (
         UserProjectPrefs.objects
-        .filter(project=project, user=user)
+        .filter(project_id=project.pk, user_id=user.pk)
+        .only("active_language", "checkpointing_override", "verbosity", "tone", "formatting")
         .first()
     )
     session = session_overrides or {}
 
     ctx: dict[str, Any] = {}
 
+    # Hard rails: a locked field keeps its policy default, so overrides for it
+    # are skipped rather than applied and then reset.
+    can_lang = policy.user_can_override_language
+    can_checkpointing = policy.user_can_override_checkpointing
+    can_output_format = policy.user_can_override_output_format
+
     # --------------------------------------------------
     # 1) Inherited defaults (via ProjectPolicy)
     # --------------------------------------------------
@@ -54,10 +64,10 @@ def resolve_effective_context(
     # --------------------------------------------------
 
     if prefs:
-        if policy.user_can_override_language and prefs.active_language:
+        if can_lang and prefs.active_language:
             ctx["language"] = prefs.active_language
 
-        if policy.user_can_override_checkpointing and prefs.checkpointing_override:
+        if can_checkpointing and prefs.checkpointing_override:
             ctx["checkpointing"] = prefs.checkpointing_override
 
         if prefs.verbosity:
@@ -73,30 +83,17 @@ def resolve_effective_context(
     # 3) Session overrides (ephemeral, highest)
     # --------------------------------------------------
 
-    if policy.user_can_override_language and "language" in session:
+    if can_lang and "language" in session:
         ctx["language"] = session["language"]
 
-    if policy.user_can_override_checkpointing and "checkpointing" in session:
+    if can_checkpointing and "checkpointing" in session:
         ctx["checkpointing"] = session["checkpointing"]
 
-    if policy.user_can_override_output_format and "output_format" in session:
+    if can_output_format and "output_format" in session:
         ctx["output_format"] = session["output_format"]
 
     # --------------------------------------------------
-    # 4) Hard rails enforcement (final)
-    # --------------------------------------------------
-
-    if not policy.user_can_override_language:
-        ctx["language"] = policy.language_default
-
-    if not policy.user_can_override_checkpointing:
-        ctx["checkpointing"] = "standard"
-
-    if not policy.user_can_override_output_format:
-        ctx["output_format"] = policy.output_format_default
-
-    # --------------------------------------------------
-    # 5) Project-only flags (never overridden)
+    # 4) Project-only flags (never overridden)
     # --------------------------------------------------
 
     ctx["feature_flags"] = policy.feature_flags or {}
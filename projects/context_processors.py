@@ -13,20 +13,10 @@ def ui_mode(request):
     view_name = getattr(rm, "view_name", "") if rm else ""
 
     # Treat any PPDE route as planning mode.
-    is_ppde = False
-    if "/ppde/" in path:
-        is_ppde = True
-    if view_name.startswith("projects:ppde_"):
-        is_ppde = True
+    is_ppde = "/ppde/" in path or view_name.startswith("projects:ppde_")
 
-    # Treat any PDE route as "definition mode" (exclude PPDE paths).
-    is_pde = False
-    if "/pde/" in path and "/ppde/" not in path:
-        is_pde = True
-    if view_name.startswith("projects:pde_"):
-        is_pde = True
-    if is_ppde:
-        is_pde = False
+    # Treat any PDE route as "definition mode" (PPDE takes precedence).
+    is_pde = not is_ppde and ("/pde/" in path or view_name.startswith("projects:pde_"))
 
     # Simple return target. Adjust if you prefer project detail.
     return_to = "/accounts/dashboard/"
@@ -18,7 +18,7 @@ from django.views.decorators.http import require_POST
 
 from chats.services.contracts.pipeline import ContractContext
 from chats.services.llm import generate_panes
-from chats.services.turns import build_chat_turn_context
+from chats.services.turns import build_chat_turn_context, chat_attachments_prefetch
 from chats.models import ChatWorkspace
 from projects.models import (
     PhaseContract,
@@ -2082,7 +2082,8 @@ def ppde_detail(request, project_id: int) -> HttpResponse:
 
     chat_ctx_map = {}
     if chat_ids:
-        chats = {c.id: c for c in ChatWorkspace.objects.filter(id__in=chat_ids)}
+        chat_qs = ChatWorkspace.objects.filter(id__in=chat_ids).prefetch_related(chat_attachments_prefetch())
+        chats = {c.id: c for c in chat_qs}
         for chat_id, chat in chats.items():
             ctx = build_chat_turn_context(request, chat)
             qs = request.GET.copy()
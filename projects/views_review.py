@@ -15,7 +15,7 @@ from django.views.decorators.http import require_POST
 from chats.services.contracts.pipeline import ContractContext
 from chats.services.llm import generate_panes
 from chats.models import ChatWorkspace
-from chats.services.turns import build_chat_turn_context
+from chats.services.turns import build_chat_turn_context, chat_attachments_prefetch
 from projects.models import (
     ProjectAnchor,
     ProjectAnchorAudit,
@@ -748,7 +748,8 @@ def project_review(request, project_id: int):
         request.session.modified = True
     chat_ctx_map = {}
     if chat_ids:
-        chat_objs = {c.id: c for c in ChatWorkspace.objects.filter(id__in=chat_ids)}
+        chat_qs = ChatWorkspace.objects.filter(id__in=chat_ids).prefetch_related(chat_attachments_prefetch())
+        chat_objs = {c.id: c for c in chat_qs}
         show_system = request.GET.get("system") in ("1", "true", "yes")
         for chat_id, chat in chat_objs.items():
             ctx = build_chat_turn_context(request, chat)
@@ -1 +1 @@
-Activate venv. ..venv\Scripts\Activate.ps1Django checkspython manage.py checkif ($LASTEXITCODE -ne 0) { exit $LASTEXITCODE }Testspython manage.py test
\ No newline at end of file
+Activate venv. ..venv\Scripts\Activate.ps1Django checkspython manage.py checkif ($LASTEXITCODE -ne 0) { exit $LASTEXITCODE }Testspython manage.py test --keepdb
\ No newline at end of file
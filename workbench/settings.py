@@ -156,6 +156,25 @@ DATABASES = {
     }
 }
 
+# Opt-in for local runs only: an on-disk test DB lets `manage.py test --keepdb`
+# reuse the migrated schema between runs. Left unset (CI, parallel runs), tests
+# keep Django's default in-memory SQLite database.
+if os.getenv("DJANGO_TEST_KEEPDB", "0").strip().lower() not in {"0", "false", "no"}:
+    DATABASES["default"]["TEST"] = {"NAME": BASE_DIR / "test_db.sqlite3"}
+
+# Shared cache: the turn list generation tokens (chats.services.turn_cache),
+# the ORG scope pk (config_ui.views_system) and the unread notification counts
+# are invalidated from signals, which only reach every worker if the cache is
+# shared between processes. The default per-process LocMemCache is not, so use
+# a database table (`manage.py createcachetable`).
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "workbench_cache",
+        "OPTIONS": {"MAX_ENTRIES": 5000},
+    }
+}
+
 
 # --------------------------------------------------
 # Password validation